@@ -0,0 +1,122 @@
+"""
+Checks that importing the library stays cheap, using `python -X importtime`.
+
+    python -m benchmarks.import_time [--repeat 5]
+
+Each statement runs in a fresh interpreter (a first, discarded run writes the bytecode
+caches). The table shows the best cumulative time of the statement's imports, the
+part of it spent in `catepyller` modules themselves, and its budget; the script exits
+with status 1 if any statement goes over its budget or imports one of the modules in
+`HEAVY` (which are only needed by a few functions, and imported by those).
+
+`tests/test_import_time.py` checks the `HEAVY` modules under pytest, and the budgets
+too when `CATEPYLLER_IMPORT_BUDGETS=1` is set (they depend on the machine).
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import NamedTuple, Optional
+
+# Statement -> budget for its cumulative import time, in milliseconds
+BUDGETS = {
+    "import catepyller": 5.0,
+    "from catepyller import List": 40.0,
+    "from catepyller import List, Option, Result": 40.0,
+}
+
+# Modules none of the statements should pull in
+HEAVY = (
+    "asyncio",
+    "concurrent.futures",
+    "dataclasses",
+    "inspect",
+    "multiprocessing",
+    "typing_extensions",
+)
+
+
+class Timing(NamedTuple):
+    total: float  # Milliseconds
+    own: float  # Milliseconds spent in `catepyller` modules themselves
+    modules: frozenset[str]
+
+
+def time_import(
+    statement: str, startup: frozenset[str] = frozenset(), write_bytecode: bool = True
+) -> Timing:
+    """
+    Times the imports of `statement`, leaving out the modules in `startup`. Unless
+    `write_bytecode` is `False`, the bytecode caches are written (even with
+    `PYTHONDONTWRITEBYTECODE` set), since they count for a lot.
+    """
+    env = {**os.environ}
+    if write_bytecode:
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    # Lines look like `import time:  self [us] | cumulative | imported package`, with
+    # the package indented under the one importing it
+    total = own = 0
+    modules = set()
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        module = name.strip()
+        if module in startup:
+            continue
+        modules.add(module)
+        if not name.startswith("  "):  # Top level, the others are counted in it
+            total += int(cumulative_us)
+        if module.startswith("catepyller"):
+            own += int(self_us)
+    return Timing(total / 1000, own / 1000, frozenset(modules))
+
+
+def heavy_imports(statement: str) -> list[str]:
+    """The modules in `HEAVY` which `statement` imports."""
+    modules = time_import(statement, write_bytecode=False).modules
+    return sorted(modules.intersection(HEAVY))
+
+
+def run(repeat: int) -> int:
+    """Prints the timings; the number of statements over budget or too heavy."""
+    startup = time_import("pass").modules  # Imported by the interpreter itself
+    failures = 0
+    print(f"{'statement':<46} {'total ms':>9} {'own ms':>7} {'budget':>7}")
+    for statement, budget in BUDGETS.items():
+        time_import(statement)  # Writes the bytecode caches
+        timings = [time_import(statement, startup) for _ in range(repeat)]
+        best = min(timings, key=lambda timing: timing.total)
+        heavy = sorted(best.modules.intersection(HEAVY))
+
+        flag = ""
+        if best.total > budget:
+            flag = "  OVER BUDGET"
+        if heavy:
+            flag += f"  imports {', '.join(heavy)}"
+        failures += bool(flag)
+        print(
+            f"{statement:<46} {best.total:>9.1f} {best.own:>7.1f} {budget:>7.1f}{flag}"
+        )
+    return failures
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.import_time")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    return 1 if run(args.repeat) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
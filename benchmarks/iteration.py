@@ -0,0 +1,68 @@
+"""
+Consuming a `List` from ordinary Python code, compared with `list` and `tuple`.
+
+    python -m benchmarks.iteration
+"""
+from __future__ import annotations
+
+import timeit
+from typing import Any, Callable
+
+from catepyller.data.list import List
+
+N = 1_000_000
+
+
+def report(name: str, *cases: tuple[str, Callable[[], Any]]) -> None:
+    timings = "".join(
+        f" {label:>6} {min(timeit.repeat(case, number=1, repeat=3)) * 1e3:>8.1f} ms"
+        for label, case in cases
+    )
+    print(f"{name:<20}{timings}")
+
+
+def main():
+    source = list(range(N))
+    lst, pylist, tup = List.from_iter(source), list(source), tuple(source)
+    missing = -1
+
+    print(f"{N:,} elements")
+    report(
+        "from list",
+        ("List", lambda: List.from_iter(source)),
+        ("list", lambda: list(source)),
+        ("tuple", lambda: tuple(source)),
+    )
+    report(
+        "from generator",
+        ("List", lambda: List.from_iter(x for x in source)),
+        ("list", lambda: list(x for x in source)),
+        ("tuple", lambda: tuple(x for x in source)),
+    )
+    report(
+        "iterate (sum)",
+        ("List", lambda: sum(lst)),
+        ("list", lambda: sum(pylist)),
+        ("tuple", lambda: sum(tup)),
+    )
+    report(
+        "reversed",
+        ("List", lambda: sum(reversed(lst))),
+        ("list", lambda: sum(reversed(pylist))),
+        ("tuple", lambda: sum(reversed(tup))),
+    )
+    report(
+        "contains (miss)",
+        ("List", lambda: missing in lst),
+        ("list", lambda: missing in pylist),
+        ("tuple", lambda: missing in tup),
+    )
+    report(
+        "to list / tuple",
+        ("list", lambda: lst.to_pylist()),
+        ("tuple", lambda: lst.to_tuple()),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Direct `map` / `apply` / `product` versus the generic `flat_map`-based defaults
+from `Monad` / `Monad2`.
+
+    python -m benchmarks.map_apply
+"""
+from __future__ import annotations
+
+import timeit
+from typing import Any, Callable
+
+from catepyller.data.list import List
+from catepyller.data.option import Some
+from catepyller.data.result import Success
+from catepyller.protocols.context import Monad
+from catepyller.protocols.context_2 import Monad2
+
+N = 1_000
+M = 10
+
+
+def inc(x: int) -> int:
+    return x + 1
+
+
+def report(name: str, direct: Callable[[], Any], default: Callable[[], Any]) -> None:
+    number = 200 if name.startswith("List") else 200_000
+    direct_us = min(timeit.repeat(direct, number=number, repeat=3)) / number * 1e6
+    default_us = min(timeit.repeat(default, number=number, repeat=3)) / number * 1e6
+    print(
+        f"{name:<24} {direct_us:>10.2f} us {default_us:>10.2f} us"
+        f" {default_us / direct_us:>6.1f}x"
+    )
+
+
+def main():
+    numbers = List.from_iter(range(N))
+    functions = List.from_iter([inc] * M)
+    others = List.from_iter(range(M))
+
+    print(f"List sizes: n={N}, m={M}")
+    print(f"{'':<24} {'direct':>13} {'default':>13}")
+
+    report("List.map", lambda: numbers.map(inc), lambda: Monad.map(numbers, inc))
+    report(
+        "List.apply",
+        lambda: numbers.apply(functions),
+        lambda: Monad.apply(numbers, functions),
+    )
+    report(
+        "List.product",
+        lambda: numbers.product(others),
+        lambda: Monad.product(numbers, others),
+    )
+
+    some, other = Some(1), Some(2)
+    some_inc = Some(inc)
+    report("Option.map", lambda: some.map(inc), lambda: Monad.map(some, inc))
+    report(
+        "Option.apply",
+        lambda: some.apply(some_inc),
+        lambda: Monad.apply(some, some_inc),
+    )
+    report(
+        "Option.product",
+        lambda: some.product(other),
+        lambda: Monad.product(some, other),
+    )
+
+    success, success_2 = Success(1), Success(2)
+    success_inc = Success(inc)
+    report("Result.map", lambda: success.map(inc), lambda: Monad2.map(success, inc))
+    report(
+        "Result.apply",
+        lambda: success.apply(success_inc),
+        lambda: Monad2.apply(success, success_inc),
+    )
+    report(
+        "Result.product",
+        lambda: success.product(success_2),
+        lambda: Monad2.product(success, success_2),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Memory and construction cost of the node types, compared with the frozen
+dataclass layout they used to have.
+
+`Elem` also stores the length of the list it starts, so its figure includes that slot
+and (for lengths above 256, which CPython doesn't cache) the `int` object holding it.
+On CPython 3.11 that takes a cell from 48 to 88 bytes, the same as the dataclass: on
+long lists, the length costs all of the memory the slots saved.
+
+`Some`, `Success` and `Failure` each also have a (lazily filled) slot caching their
+hash, and still take 56 bytes against 88. `Elem` has no such slot, so that it doesn't
+grow past the dataclass.
+
+    python -m benchmarks.node_memory
+"""
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from catepyller.data.list import Elem, Nil
+from catepyller.data.option import Some
+from catepyller.data.result import Failure, Success
+
+N = 1_000_000
+
+
+@dataclass(frozen=True, repr=False)
+class DataclassElem:
+    value: Any
+    following: Any = None
+
+
+@dataclass(frozen=True, repr=False)
+class DataclassWrapper:
+    value: Any
+
+
+# Every node wraps the same object, so only the nodes themselves are measured
+VALUE = object()
+
+
+def build_chain(cell: Callable[[Any, Any], Any], tail: Any) -> Any:
+    node = tail
+    for _ in range(N):
+        node = cell(VALUE, node)
+    return node
+
+
+def build_wrappers(wrapper: Callable[[Any], Any]) -> list[Any]:
+    return [wrapper(VALUE) for _ in range(N)]
+
+
+def measure(build: Callable[[], Any]) -> tuple[float, float]:
+    """Returns (bytes per node, nanoseconds per node)."""
+    gc.collect()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return allocated / N, elapsed / N * 1e9
+
+
+def report(name: str, build: Callable[[], Any]) -> None:
+    per_node, ns = measure(build)
+    print(f"{name:<24} {per_node:>8.1f} B/node {ns:>10.1f} ns/node")
+
+
+def main():
+    print(f"{N:,} nodes each")
+    report("Elem", lambda: build_chain(Elem, Nil))
+    report("dataclass cons cell", lambda: build_chain(DataclassElem, None))
+    report("Some", lambda: build_wrappers(Some))
+    report("Success", lambda: build_wrappers(Success))
+    report("Failure", lambda: build_wrappers(Failure))
+    report("dataclass wrapper", lambda: build_wrappers(DataclassWrapper))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+`List.par_map` over a process pool with an increasing number of workers, versus the
+sequential `List.map`, for a CPU-bound function.
+
+    python -m benchmarks.parallel
+"""
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+from catepyller.data.list import List
+
+N = 2_000
+WORK = 5_000
+
+
+def busy(x: int) -> int:
+    total = 0
+    for i in range(WORK):
+        total += (x * i) % 7
+    return total
+
+
+def measure(f: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    f()
+    return time.perf_counter() - start
+
+
+def main():
+    numbers = List.from_iter(range(N))
+    expected = numbers.map(busy)
+
+    sequential = min(measure(lambda: numbers.map(busy)) for _ in range(3))
+    print(f"n={N}, cpus={os.cpu_count()}")
+    print(f"{'List.map':<20} {sequential * 1e3:>8.1f} ms")
+
+    workers = 1
+    while workers <= max(4, os.cpu_count() or 1):
+        # Start the pool up front, so the timing doesn't include spawning the workers
+        with ProcessPoolExecutor(workers) as pool:
+            assert numbers.par_map(busy, executor=pool, max_workers=workers) == expected
+            elapsed = min(
+                measure(
+                    lambda: numbers.par_map(busy, executor=pool, max_workers=workers)
+                )
+                for _ in range(3)
+            )
+        print(
+            f"{f'par_map({workers})':<20} {elapsed * 1e3:>8.1f} ms"
+            f" {sequential / elapsed:>6.2f}x"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
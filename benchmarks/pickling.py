@@ -0,0 +1,71 @@
+"""
+Pickle payload size and round-trip time of a `List`, compared with a plain `list` and
+with the one-record-per-cell layout `Elem` used to pickle as (which recurses once per
+cell, so it can only be measured on lists shorter than the recursion limit).
+
+    python -m benchmarks.pickling
+"""
+from __future__ import annotations
+
+import pickle
+import sys
+import time
+from typing import Any
+
+from catepyller.data.list import Elem, List, Nil
+
+
+class NestedElem:
+    """Pickles like `Elem` used to: its value and (recursively) the rest of the list."""
+
+    __slots__ = ("value", "following")
+
+    def __init__(self, value: Any, following: Any = None) -> None:
+        self.value = value
+        self.following = following
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (NestedElem, (self.value, self.following))
+
+
+def nested(n: int) -> NestedElem | None:
+    lst = None
+    for value in reversed(range(n)):
+        lst = NestedElem(value, lst)
+    return lst
+
+
+def round_trip(obj: Any, repeat: int = 5) -> tuple[int, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        payload = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+        pickle.loads(payload)
+        best = min(best, time.perf_counter() - start)
+    return len(payload), best
+
+
+def report(name: str, n: int, obj: Any) -> None:
+    size, elapsed = round_trip(obj)
+    print(
+        f"{name:<12} {n:>9,} {size / n:>10.1f} B/elem"
+        f" {elapsed / n * 1e9:>10.1f} ns/elem"
+    )
+
+
+def main():
+    for n in (sys.getrecursionlimit() // 4, 1_000_000):
+        lst = List.from_iter(range(n))
+        assert type(lst) is Elem
+        assert pickle.loads(pickle.dumps(lst)) == lst
+        assert pickle.loads(pickle.dumps(Nil)) is Nil
+
+        report("List", n, lst)
+        report("list", n, list(range(n)))
+        if n < sys.getrecursionlimit() // 2:
+            report("nested", n, nested(n))
+        print()
+
+
+if __name__ == "__main__":
+    main()
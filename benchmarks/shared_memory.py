@@ -0,0 +1,47 @@
+"""
+Cost of handing a large sequence of numbers to a worker process: pickling the values
+themselves (a `tuple`, a `List`) versus a `SharedSequence`, which pickles as the name
+of its shared block.
+
+    python -m benchmarks.shared_memory
+"""
+from __future__ import annotations
+
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Iterable
+
+from catepyller.data.list import List
+from catepyller.data.shared import SharedSequence
+
+N = 2_000_000
+TASKS = 8
+
+
+def total(values: Iterable[float]) -> float:
+    return sum(islice(values, 10))
+
+
+def report(name: str, pool: ProcessPoolExecutor, values: Any) -> None:
+    payload = len(pickle.dumps(values, pickle.HIGHEST_PROTOCOL))
+    start = time.perf_counter()
+    list(pool.map(total, [values] * TASKS))
+    elapsed = time.perf_counter() - start
+    print(f"{name:<16} {payload:>12,} B {elapsed / TASKS * 1e3:>10.1f} ms/task")
+
+
+def main():
+    values = tuple(float(x) for x in range(N))
+    print(f"n={N:,}, {TASKS} tasks")
+    with ProcessPoolExecutor(2) as pool:
+        pool.submit(int).result()  # Start the workers before timing anything
+        report("tuple", pool, values)
+        report("List", pool, List.from_iter(values))
+        with SharedSequence.from_iter(values) as shared:
+            report("SharedSequence", pool, shared)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Sorting a `List` compared with round-tripping it through the built-in `sorted`, and
+picking the top 100 values with `top_k` compared with a full sort.
+
+    python -m benchmarks.sorting [n]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from typing import Any, Callable
+
+from catepyller.data.list import List
+
+
+def best(f: Callable[[], Any], repeat: int = 5) -> float:
+    elapsed = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return elapsed
+
+
+def report(name: str, elapsed: float, baseline: float) -> None:
+    print(f"{name:<36} {elapsed * 1e3:>10.1f} ms {elapsed / baseline:>8.2f}x")
+
+
+def main(n: int) -> None:
+    rng = random.Random(0)
+    values = [rng.random() for _ in range(n)]
+    lst = List.from_iter(values)
+    records = List.from_iter((rng.randrange(n), i) for i in range(n))
+
+    assert List.sorted(lst).to_pylist() == sorted(values)
+    assert records.top_k(100) == List.from_iter(sorted(records, reverse=True)[:100])
+
+    print(f"n = {n:,}")
+    baseline = best(lambda: List.sorted(lst))
+    report("List.sorted", baseline, baseline)
+    report(
+        "List.from_iter(sorted(List))",
+        best(lambda: List.from_iter(sorted(lst))),
+        baseline,
+    )
+    report(
+        "List.from_iter(sorted(to_pylist()))",
+        best(lambda: List.from_iter(sorted(lst.to_pylist()))),
+        baseline,
+    )
+    report("sorted(list)", best(lambda: sorted(values)), baseline)
+    print()
+
+    half = List.sorted(lst.take_first(n // 2))
+    other = List.sorted(lst.drop_first(n // 2))
+    baseline = best(lambda: half.merge(other))
+    report("List.merge", baseline, baseline)
+    report(
+        "List.sorted(half.extend(other))",
+        best(lambda: List.sorted(half.extend(other))),
+        baseline,
+    )
+    print()
+
+    baseline = best(lambda: records.top_k(100))
+    report("List.top_k(100)", baseline, baseline)
+    report(
+        "List.sorted(reverse=True)[:100]",
+        best(lambda: List.sorted(records, reverse=True).take_first(100)),
+        baseline,
+    )
+    report(
+        "sorted(list, reverse=True)[:100]",
+        best(lambda: sorted(records.to_pylist(), reverse=True)[:100]),
+        baseline,
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,286 @@
+"""
+Benchmark suite for the hot paths of the data types, each measured against the plain
+Python equivalents (`list`, `tuple`, `collections.deque`, `None` checks).
+
+    python -m benchmarks.suite run [--output results.json] [--only map]
+    python -m benchmarks.suite compare before.json after.json [--threshold 0.1]
+
+`run` prints a table (with each case's time relative to the library's own case in
+its group) and, with `--output`, writes the results as JSON. `compare` lines up two
+such files case by case and flags every case which got slower by more than
+`threshold` (10% by default); it exits with status 1 if there are any, so it can gate
+CI.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from collections import Counter, deque
+from functools import reduce
+from operator import add
+from typing import Any, Callable, NamedTuple, Optional
+
+from catepyller.data.list import List
+from catepyller.data.option import Nothing, Option, Some
+from catepyller.data.result import Failure, Result, Success
+from catepyller.functions.semigroup import combine, combine_all
+
+N = 1_000
+
+
+class Case(NamedTuple):
+    """One operation (`group`) done one way (`name`): `f` runs it once."""
+
+    group: str
+    name: str
+    f: Callable[[], Any]
+
+    @property
+    def key(self) -> str:
+        return f"{self.group}/{self.name}"
+
+
+def inc(x: int) -> int:
+    return x + 1
+
+
+def is_even(x: int) -> bool:
+    return x % 2 == 0
+
+
+def cases() -> list[Case]:
+    values = range(N)
+    lst, pylist = List.from_iter(values), list(values)
+    tup, dq = tuple(values), deque(values)
+    small = tuple(range(10))
+    one: Optional[int] = 1
+    none: Optional[int] = None
+    some, success, failure = Some(1), Success(1), Failure("oops")
+
+    def option_chain(x: Optional[int]) -> Option[int]:
+        return (
+            Option.from_optional(x)
+            .map(inc)
+            .flat_map(lambda y: Some(y) if y % 2 == 0 else Nothing)
+            .map(inc)
+        )
+
+    def none_chain(x: Optional[int]) -> Optional[int]:
+        if x is None:
+            return None
+        y = inc(x)
+        if y % 2 != 0:
+            return None
+        return inc(y)
+
+    def result_chain(x: int) -> Result[int, str]:
+        return (
+            Success(x)
+            .map(inc)
+            .flat_map(lambda y: Success(y) if y % 2 == 0 else Failure("odd"))
+            .map(inc)
+        )
+
+    def exception_chain(x: int) -> int:
+        try:
+            y = inc(x)
+            if y % 2 != 0:
+                raise ValueError("odd")
+            return inc(y)
+        except ValueError:
+            return -1
+
+    return [
+        # --- Construction ---
+        Case("of", "List", lambda: List.of(*small)),
+        Case("of", "list", lambda: list(small)),
+        Case("of", "tuple", lambda: tuple(small)),
+        Case("of", "deque", lambda: deque(small)),
+        Case("from_iter", "List", lambda: List.from_iter(values)),
+        Case("from_iter", "list", lambda: list(values)),
+        Case("from_iter", "tuple", lambda: tuple(values)),
+        Case("from_iter", "deque", lambda: deque(values)),
+        # --- Transforms ---
+        Case("map", "List", lambda: lst.map(inc)),
+        Case("map", "list", lambda: [inc(x) for x in pylist]),
+        Case("map", "tuple", lambda: tuple(map(inc, tup))),
+        Case("map", "deque", lambda: deque(map(inc, dq))),
+        Case("filter", "List", lambda: lst.filter(is_even)),
+        Case("filter", "list", lambda: [x for x in pylist if is_even(x)]),
+        Case("filter", "tuple", lambda: tuple(filter(is_even, tup))),
+        Case("filter", "deque", lambda: deque(filter(is_even, dq))),
+        Case("flat_map", "List", lambda: lst.flat_map(lambda x: List.of(x, x))),
+        Case("flat_map", "list", lambda: [y for x in pylist for y in (x, x)]),
+        Case("flat_map", "tuple", lambda: tuple(y for x in tup for y in (x, x))),
+        Case("flat_map", "deque", lambda: deque(y for x in dq for y in (x, x))),
+        Case("extend", "List", lambda: lst.extend(lst)),
+        Case("extend", "list", lambda: pylist + pylist),
+        Case("extend", "tuple", lambda: tup + tup),
+        Case("extend", "deque", lambda: deque(dq).extend(dq)),
+        Case("prepend", "List", lambda: lst.prepend(-1)),
+        Case("prepend", "list", lambda: [-1, *pylist]),
+        Case("prepend", "tuple", lambda: (-1, *tup)),
+        Case("prepend", "deque", lambda: deque(dq).appendleft(-1)),
+        Case("reverse", "List", lambda: lst.reverse()),
+        Case("reverse", "list", lambda: pylist[::-1]),
+        Case("reverse", "tuple", lambda: tup[::-1]),
+        Case("reverse", "deque", lambda: deque(reversed(dq))),
+        Case("fold_left", "List", lambda: lst.fold_left(0, add)),
+        Case("fold_left", "reduce", lambda: reduce(add, pylist, 0)),
+        Case("fold_left", "sum", lambda: sum(pylist)),
+        Case("fold_right", "List", lambda: lst.fold_right(0, add)),
+        Case("fold_right", "reduce", lambda: reduce(add, reversed(pylist), 0)),
+        # --- Grouping ---
+        Case("group_by", "List", lambda: lst.group_by(is_even)),
+        Case("group_by", "list", lambda: _group_by(is_even, pylist)),
+        Case("count_by", "List", lambda: lst.count_by(is_even)),
+        Case("count_by", "list", lambda: Counter(map(is_even, pylist))),
+        Case("distinct", "List", lambda: lst.distinct()),
+        Case("distinct", "list", lambda: list(dict.fromkeys(pylist))),
+        Case("partition", "List", lambda: lst.partition(is_even)),
+        Case(
+            "partition",
+            "List.filter",
+            lambda: (lst.filter(is_even), lst.filter_not(is_even)),
+        ),
+        Case("partition", "list", lambda: _partition(is_even, pylist)),
+        # --- Option / Result ---
+        Case("option_map", "Option", lambda: some.map(inc)),
+        Case("option_map", "None", lambda: None if one is None else inc(one)),
+        Case("option_map_empty", "Option", lambda: Nothing.map(inc)),
+        Case("option_map_empty", "None", lambda: None if none is None else inc(none)),
+        Case("result_map", "Result", lambda: success.map(inc)),
+        Case("result_map", "call", lambda: inc(one)),
+        Case("result_map_failure", "Result", lambda: failure.map(inc)),
+        Case("result_map_failure", "call", lambda: _noop()),
+        Case("option_chain", "Option", lambda: option_chain(1)),
+        Case("option_chain", "None", lambda: none_chain(1)),
+        Case("option_chain_empty", "Option", lambda: option_chain(None)),
+        Case("option_chain_empty", "None", lambda: none_chain(None)),
+        Case("result_chain", "Result", lambda: result_chain(1)),
+        Case("result_chain", "exception", lambda: exception_chain(1)),
+        Case("result_chain_failure", "Result", lambda: result_chain(2)),
+        Case("result_chain_failure", "exception", lambda: exception_chain(2)),
+        # --- combine ---
+        Case("combine", "List", lambda: combine(lst, lst)),
+        Case("combine", "list", lambda: combine(pylist, pylist)),
+        Case("combine", "tuple", lambda: combine(tup, tup)),
+        Case("combine_option", "Option", lambda: combine(Some(1), Some(2))),
+        Case("combine_option", "None", lambda: _combine_optional(1, 2)),
+        Case("combine_all", "List", lambda: combine_all(lst)),
+        Case("combine_all", "reduce", lambda: reduce(add, pylist)),
+        Case("combine_all", "sum", lambda: sum(pylist)),
+    ]
+
+
+def _noop() -> None:
+    pass
+
+
+def _group_by(f: Callable[[Any], Any], values: list[Any]) -> dict[Any, list[Any]]:
+    groups: dict[Any, list[Any]] = {}
+    for value in values:
+        groups.setdefault(f(value), []).append(value)
+    return groups
+
+
+def _partition(f: Callable[[Any], bool], values: list[Any]) -> tuple[list, list]:
+    matching, rest = [], []
+    for value in values:
+        (matching if f(value) else rest).append(value)
+    return matching, rest
+
+
+def _combine_optional(a: Optional[int], b: Optional[int]) -> Optional[int]:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return a + b
+
+
+# --- Running ---
+
+
+def measure(f: Callable[[], Any], repeat: int) -> float:
+    """Best time of a single call, in nanoseconds."""
+    timer = timeit.Timer(f)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def run(only: Optional[str], repeat: int) -> dict[str, float]:
+    results: dict[str, float] = {}
+    baselines: dict[str, float] = {}
+    print(f"{'case':<36} {'ns/call':>12} {'relative':>9}")
+    for case in cases():
+        if only is not None and only not in case.key:
+            continue
+        ns = results[case.key] = measure(case.f, repeat)
+        baseline = baselines.setdefault(case.group, ns)
+        print(f"{case.key:<36} {ns:>12,.0f} {ns / baseline:>8.2f}x")
+    return results
+
+
+def compare(before: dict[str, Any], after: dict[str, Any], threshold: float) -> int:
+    """Prints the change of every case in both runs; the number of regressions."""
+    old, new = before["results"], after["results"]
+    regressions = 0
+    print(f"{'case':<36} {'before':>12} {'after':>12} {'change':>8}")
+    for key in sorted(old.keys() & new.keys()):
+        change = new[key] / old[key] - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif change < -threshold:
+            flag = "  improved"
+        print(f"{key:<36} {old[key]:>12,.0f} {new[key]:>12,.0f} {change:>+8.1%}{flag}")
+    for key in sorted(old.keys() ^ new.keys()):
+        print(f"{key:<36} only in {'before' if key in old else 'after'}")
+    print(f"\n{regressions} regression(s) above {threshold:.0%}")
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--output", help="write the results to this JSON file")
+    run_parser.add_argument("--only", help="only run cases whose name contains this")
+    run_parser.add_argument("--repeat", type=int, default=5)
+
+    compare_parser = commands.add_parser("compare", help="compare two runs")
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        results = run(args.only, args.repeat)
+        if args.output:
+            with open(args.output, "w") as file:
+                json.dump(
+                    {
+                        "python": platform.python_version(),
+                        "implementation": platform.python_implementation(),
+                        "machine": platform.machine(),
+                        "n": N,
+                        "results": results,
+                    },
+                    file,
+                    indent=2,
+                )
+        return 0
+    else:
+        with open(args.before) as before, open(args.after) as after:
+            regressions = compare(json.load(before), json.load(after), args.threshold)
+        return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+The main types and functions are available from the top-level package, e.g.
+`from catepyller import List, Some`. Each is only imported (along with the module
+defining it) the first time it is used, so `import catepyller` itself costs next to
+nothing.
+"""
+from __future__ import annotations
+
+from importlib import import_module
+
+# Not imported from `typing`, which is comparatively slow to import
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from catepyller.data.catenable_list import CatenableList, CatenableNil
+    from catepyller.data.chunked_list import ChunkedList, ChunkedNil
+    from catepyller.data.lazy_list import LazyList, LazyNil
+    from catepyller.data.list import Elem, List, Nil, UnexpectedNilError
+    from catepyller.data.option import (
+        Nothing,
+        Option,
+        Some,
+        UnexpectedNothingException,
+    )
+    from catepyller.data.result import Failure, Result, Success
+    from catepyller.data.sequence_view import SequenceView
+    from catepyller.data.shared import SharedSequence
+    from catepyller.data.vector import Vector
+    from catepyller.data.view import View
+    from catepyller.functions.asynchronous import map_async, traverse_async
+    from catepyller.functions.monad import flatten
+    from catepyller.functions.parallel import par_filter, par_flat_map, par_map
+    from catepyller.functions.semigroup import combine, combine_all
+    from catepyller.functions.traverse import (
+        sequence_option,
+        sequence_result,
+        traverse_option,
+        traverse_result,
+    )
+
+# Name -> module it is defined in
+_EXPORTS = {
+    "CatenableList": "catepyller.data.catenable_list",
+    "CatenableNil": "catepyller.data.catenable_list",
+    "ChunkedList": "catepyller.data.chunked_list",
+    "ChunkedNil": "catepyller.data.chunked_list",
+    "LazyList": "catepyller.data.lazy_list",
+    "LazyNil": "catepyller.data.lazy_list",
+    "Elem": "catepyller.data.list",
+    "List": "catepyller.data.list",
+    "Nil": "catepyller.data.list",
+    "UnexpectedNilError": "catepyller.data.list",
+    "Nothing": "catepyller.data.option",
+    "Option": "catepyller.data.option",
+    "Some": "catepyller.data.option",
+    "UnexpectedNothingException": "catepyller.data.option",
+    "Failure": "catepyller.data.result",
+    "Result": "catepyller.data.result",
+    "Success": "catepyller.data.result",
+    "SequenceView": "catepyller.data.sequence_view",
+    "SharedSequence": "catepyller.data.shared",
+    "Vector": "catepyller.data.vector",
+    "View": "catepyller.data.view",
+    "map_async": "catepyller.functions.asynchronous",
+    "traverse_async": "catepyller.functions.asynchronous",
+    "flatten": "catepyller.functions.monad",
+    "par_filter": "catepyller.functions.parallel",
+    "par_flat_map": "catepyller.functions.parallel",
+    "par_map": "catepyller.functions.parallel",
+    "combine": "catepyller.functions.semigroup",
+    "combine_all": "catepyller.functions.semigroup",
+    "sequence_option": "catepyller.functions.traverse",
+    "sequence_result": "catepyller.functions.traverse",
+    "traverse_option": "catepyller.functions.traverse",
+    "traverse_result": "catepyller.functions.traverse",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    >>> import catepyller
+    >>> catepyller.List.of(1, 2)
+    1 :: 2 :: Nil
+    >>> catepyller.Missing
+    Traceback (most recent call last):
+    ...
+    AttributeError: module 'catepyller' has no attribute 'Missing'
+    """
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), name)
+    globals()[name] = value  # Later lookups don't come through here
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
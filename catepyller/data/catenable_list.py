@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+from itertools import chain
+from typing import Any, Callable, Iterable, Iterator, TypeVar, final
+
+from catepyller.data.list import Elem, List, Nil, NilType, UnexpectedNilError
+from catepyller.data.list import _values as _list_values
+from catepyller.protocols import Monad
+from catepyller.protocols.has_empty import SupportsEmpty
+from catepyller.util import Frozen, Singleton, equal_elements
+
+A = TypeVar("A")
+B = TypeVar("B", contravariant=True)
+
+T = TypeVar("T")
+
+
+class CatenableList(Monad[A], SupportsEmpty[A]):
+    """
+    Persistent list with O(1) `extend` (after Okasaki's catenable lists).
+
+    A non-empty list is a tree: a node holds a non-empty `List` segment and a queue of
+    child `CatenableList`s which come after it. `extend` just adds its argument to the
+    end of that queue, and a whole `List` can be wrapped as a segment without copying
+    it (`from_list`), so repeatedly appending large lists costs O(1) per append rather
+    than a copy of everything accumulated so far.
+
+    `first` is O(1), and `drop_first` is amortized O(1) (when the list is used
+    single-threaded): it is O(1) within a segment, and re-links the children of a node
+    once its segment is used up.
+
+    >>> logs = CatenableList.empty()
+    >>> for batch in range(3):
+    ...     logs = logs.extend(CatenableList.of(f"{batch}a", f"{batch}b"))
+    >>> logs
+    CatenableList('0a', '0b', '1a', '1b', '2a', '2b')
+    >>> logs.drop_first(3).first()
+    '1b'
+    """
+
+    __slots__ = ()
+
+    # === STATIC ===
+
+    @staticmethod
+    def of(head: T, *args: T) -> CatenableList[T]:
+        """
+        >>> CatenableList.of(1, 2, 3)
+        CatenableList(1, 2, 3)
+        """
+        return CatenableList.from_list(List.of(head, *args))
+
+    @staticmethod
+    def from_iter(iterable: Iterable[T]) -> CatenableList[T]:
+        """
+        >>> CatenableList.from_iter(range(3))
+        CatenableList(0, 1, 2)
+        """
+        return CatenableList.from_list(List.from_iter(iterable))
+
+    @staticmethod
+    def from_list(lst: List[T]) -> CatenableList[T]:
+        """
+        O(1), `lst` is shared rather than copied.
+
+        >>> CatenableList.from_list(List.of(1, 2))
+        CatenableList(1, 2)
+        >>> CatenableList.from_list([1, 2])
+        Traceback (most recent call last):
+        ...
+        TypeError: Expected a List, got list
+        """
+        if type(lst) is Elem:
+            return CatenableNode(lst, Nil, Nil, lst.length)
+        elif type(lst) is NilType:
+            return CatenableNil
+        raise TypeError(f"Expected a List, got {type(lst).__name__}")
+
+    @staticmethod
+    def empty() -> CatenableList[Any]:
+        """
+        >>> CatenableList.empty()
+        CatenableNil
+        """
+        return CatenableNil
+
+    @staticmethod
+    def pure(value: T) -> Any[T]:
+        """
+        >>> CatenableList.pure(1)
+        CatenableList(1)
+        """
+        return CatenableNode(Elem(value), Nil, Nil, 1)
+
+    # === INSTANCE ===
+
+    length: int
+
+    def __len__(self) -> int:
+        """
+        >>> len(CatenableList.of(1, 2).extend(CatenableList.of(3)))
+        3
+        """
+        return self.length
+
+    # --- `Monad` methods ---
+
+    def flat_map(self, f: Callable[[A], CatenableList[B]]) -> CatenableList[B]:
+        """
+        >>> CatenableList.of(1, 2).flat_map(lambda x: CatenableList.of(x, x * 10))
+        CatenableList(1, 10, 2, 20)
+        """
+        return CatenableList.from_iter(chain.from_iterable(map(f, _values(self))))
+
+    def map(self, f: Callable[[A], B]) -> CatenableList[B]:
+        """
+        >>> CatenableList.of(1, 2).map(lambda x: x + 1)
+        CatenableList(2, 3)
+        """
+        return CatenableList.from_iter(map(f, _values(self)))
+
+    def apply(self, f: CatenableList[Callable[[A], B]]) -> CatenableList[B]:
+        return super().apply(f)
+
+    # --- Construct new lists ---
+
+    def prepend(self, value: A) -> CatenableList[A]:
+        """
+        >>> CatenableList.of(1, 2).prepend(0)
+        CatenableList(0, 1, 2)
+        """
+        if type(self) is CatenableNode:
+            return CatenableNode(
+                Elem(value, self.segment), self._front, self._rear, self.length + 1
+            )
+        else:
+            return CatenableList.pure(value)
+
+    def extend(self, l: CatenableList[A] | List[A]) -> CatenableList[A]:
+        """
+        O(1), neither list is copied. `l` can also be a `List`.
+
+        >>> CatenableList.of(1, 2).extend(CatenableList.of(3))
+        CatenableList(1, 2, 3)
+        >>> CatenableList.of(1).extend(List.of(2, 3))
+        CatenableList(1, 2, 3)
+        >>> CatenableList.of(1).extend([2, 3])
+        Traceback (most recent call last):
+        ...
+        TypeError: Expected a CatenableList or a List, got list
+        """
+        if type(l) is not CatenableNode:
+            if l is CatenableNil:
+                return self
+            if type(l) is not Elem and type(l) is not NilType:
+                raise TypeError(
+                    f"Expected a CatenableList or a List, got {type(l).__name__}"
+                )
+            l = CatenableList.from_list(l)  # type: ignore[arg-type]
+            if l is CatenableNil:
+                return self
+        if type(self) is not CatenableNode:
+            return l
+        return _link(self, l)  # type: ignore[arg-type]
+
+    # --- Access ---
+
+    def first(self) -> A:
+        """
+        >>> CatenableList.of(1, 2).first()
+        1
+        """
+        if type(self) is CatenableNode:
+            return self.segment.value  # type: ignore[attr-defined]
+        else:
+            raise UnexpectedNilError("Cannot call `first()` on `CatenableNil`")
+
+    def drop_first(self, n: int = 1) -> CatenableList[A]:
+        """
+        >>> CatenableList.of(1, 2, 3).drop_first(2)
+        CatenableList(3)
+        """
+        assert n >= 1
+        if n > self.length:
+            raise UnexpectedNilError("Cannot call `drop_first()` on `CatenableNil`")
+        node: CatenableList[A] = self
+        for _ in range(n):
+            node = _tail(node)  # type: ignore[arg-type]
+        return node
+
+    def split_first(self) -> tuple[A, CatenableList[A]]:
+        """
+        >>> CatenableList.of(1, 2, 3).split_first()
+        (1, CatenableList(2, 3))
+        """
+        if type(self) is CatenableNode:
+            return self.first(), _tail(self)
+        else:
+            raise UnexpectedNilError("Cannot call `split_first()` on `CatenableNil`")
+
+    # --- Modifiers ---
+
+    def filter(self, f: Callable[[A], bool]) -> CatenableList[A]:
+        """
+        >>> CatenableList.of(1, 2, 3).filter(lambda x: x != 2)
+        CatenableList(1, 3)
+        """
+        return CatenableList.from_iter(filter(f, _values(self)))
+
+    # --- Convert ---
+
+    def __iter__(self) -> Iterator[A]:
+        return _values(self)
+
+    def to_list(self) -> List[A]:
+        """
+        >>> CatenableList.of(1).extend(CatenableList.of(2)).to_list()
+        1 :: 2 :: Nil
+        """
+        if type(self) is CatenableNode and self._front is Nil:
+            return self.segment
+        return List.from_iter(_values(self))
+
+
+@final
+class CatenableNilType(CatenableList[A], Singleton):
+    __slots__ = ()
+
+    length = 0
+
+    def __reduce__(self) -> str:
+        """Pickled by reference, so unpickling gives back the same `CatenableNil`."""
+        return "CatenableNil"
+
+    def __repr__(self) -> str:
+        """
+        >>> CatenableNilType()
+        CatenableNil
+        """
+        return "CatenableNil"
+
+
+CatenableNil: CatenableNilType = CatenableNilType()
+
+
+@final
+class CatenableNode(CatenableList[A], Frozen):
+    """
+    A non-empty `segment` followed by a queue of child lists. The queue is split into
+    `_front` (in order) and `_rear` (reversed), so pushing a child is O(1); children are
+    only ever read all together, once the segment is used up.
+    """
+
+    __slots__ = ("segment", "_front", "_rear", "length")
+
+    segment: Elem[A]
+    _front: List[CatenableNode[A]]
+    _rear: List[CatenableNode[A]]
+    length: int
+
+    def __init__(
+        self,
+        segment: Elem[A],
+        front: List[CatenableNode[A]],
+        rear: List[CatenableNode[A]],
+        length: int,
+    ) -> None:
+        object.__setattr__(self, "segment", segment)
+        object.__setattr__(self, "_front", front)
+        object.__setattr__(self, "_rear", rear)
+        object.__setattr__(self, "length", length)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return equal_elements(self, other)  # type: ignore[arg-type]
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (CatenableList.from_iter, (tuple(self),))
+
+    def __repr__(self) -> str:
+        return f"CatenableList({', '.join(map(repr, self))})"
+
+
+# --- Helpers ---
+
+
+def _link(node: CatenableNode[T], child: CatenableNode[T]) -> CatenableNode[T]:
+    """`node` with `child` pushed onto the end of its queue."""
+    front: List[CatenableNode[T]]
+    rear: List[CatenableNode[T]]
+    if node._front is Nil:
+        front, rear = Elem(child), Nil
+    else:
+        front, rear = node._front, Elem(child, node._rear)
+    return CatenableNode(node.segment, front, rear, node.length + child.length)
+
+
+def _tail(node: CatenableNode[T]) -> CatenableList[T]:
+    following = node.segment.following
+    if type(following) is Elem:
+        return CatenableNode(following, node._front, node._rear, node.length - 1)
+
+    # The segment is used up: link the children right-to-left, so each one ends up at
+    # the back of the queue of the one before it
+    children = list(_children(node))
+    if not children:
+        return CatenableNil
+    linked = children.pop()
+    for child in reversed(children):
+        linked = _link(child, linked)
+    return linked
+
+
+def _children(node: CatenableNode[T]) -> Iterator[CatenableNode[T]]:
+    return chain(_list_values(node._front), _list_values(node._rear.reverse()))
+
+
+def _values(lst: CatenableList[T]) -> Iterator[T]:
+    """Pre-order walk of the tree, with an explicit stack instead of recursion."""
+    stack: list[Iterator[CatenableNode[T]]] = []
+    if type(lst) is CatenableNode:
+        stack.append(iter((lst,)))
+    while stack:
+        for node in stack[-1]:
+            yield from _list_values(node.segment)
+            stack.append(_children(node))
+            break
+        else:
+            stack.pop()
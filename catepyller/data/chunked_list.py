@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+from itertools import chain, islice
+from typing import Any, Callable, Iterable, Iterator, TypeVar, final
+
+from catepyller.data.list import UnexpectedNilError
+from catepyller.protocols import Monad
+from catepyller.protocols.has_empty import SupportsEmpty
+from catepyller.util import Frozen, Singleton
+
+A = TypeVar("A")
+B = TypeVar("B", contravariant=True)
+
+T = TypeVar("T")
+
+CHUNK_SIZE = 32
+
+
+class ChunkedList(Monad[A], SupportsEmpty[A]):
+    """
+    Persistent list which stores its elements in immutable tuples of up to
+    `CHUNK_SIZE` values (an "unrolled" linked list), instead of one `Elem` per value.
+
+    Bulk operations (`map`, `filter`, `reverse`, ...) work a chunk at a time, and
+    `prepend` / `drop_first` copy at most one chunk, so they stay O(1) amortized.
+    """
+
+    __slots__ = ()
+
+    # === STATIC ===
+
+    @staticmethod
+    def of(head: T, *args: T) -> Chunk[T]:
+        """
+        >>> ChunkedList.of(1, 2, 3)
+        ChunkedList(1, 2, 3)
+        """
+        return ChunkedList.from_iter((head, *args))  # type: ignore[return-value]
+
+    @staticmethod
+    def from_iter(iterable: Iterable[T]) -> ChunkedList[T]:
+        """
+        >>> ChunkedList.from_iter(range(3))
+        ChunkedList(0, 1, 2)
+        >>> ChunkedList.from_iter(range(100)).chunk_sizes()
+        (32, 32, 32, 4)
+        """
+        return _build(iterable)
+
+    @staticmethod
+    def empty() -> ChunkedList[Any]:
+        """
+        >>> ChunkedList.empty()
+        ChunkedNil
+        """
+        return ChunkedNil
+
+    @staticmethod
+    def pure(value: T) -> Any[T]:
+        """
+        >>> ChunkedList.pure(1)
+        ChunkedList(1)
+        """
+        return Chunk((value,))
+
+    # === INSTANCE ===
+
+    # --- `Monad` methods ---
+
+    def flat_map(self, f: Callable[[A], ChunkedList[B]]) -> ChunkedList[B]:
+        """
+        >>> ChunkedList.of(1, 2).flat_map(lambda x: ChunkedList.of(x, x * 10))
+        ChunkedList(1, 10, 2, 20)
+        >>> ChunkedList.of(1, 2).flat_map(lambda x: [x])
+        Traceback (most recent call last):
+        ...
+        TypeError: Expected `f` to return a ChunkedList, got list
+        """
+        return _build(_flat_map_values(self, f))
+
+    def map(self, f: Callable[[A], B]) -> ChunkedList[B]:
+        """
+        Maps each chunk in one go, keeping the chunk layout of `self`.
+
+        >>> ChunkedList.of(1, 2, 3).map(lambda x: x * 2)
+        ChunkedList(2, 4, 6)
+        """
+        return _link(tuple(map(f, values)) for values in _chunks(self))
+
+    def apply(self, f: ChunkedList[Callable[[A], B]]) -> ChunkedList[B]:
+        return super().apply(f)
+
+    # --- Construct new lists ---
+
+    def prepend(self, value: A) -> ChunkedList[A]:
+        """
+        >>> ChunkedList.of(1, 2, 3).prepend(0)
+        ChunkedList(0, 1, 2, 3)
+        >>> ChunkedList.from_iter(range(32)).prepend(-1).chunk_sizes()
+        (1, 32)
+        """
+        if type(self) is Chunk and len(self.values) < CHUNK_SIZE:
+            return Chunk((value, *self.values), self.following)
+        else:
+            return Chunk((value,), self)
+
+    def extend(self, l: ChunkedList[A]) -> ChunkedList[A]:
+        """
+        Only the chunk nodes of `self` are copied; the chunks themselves are shared.
+
+        >>> ChunkedList.of(1, 2, 3).extend(ChunkedList.of(4, 5))
+        ChunkedList(1, 2, 3, 4, 5)
+        """
+        return _link(_chunks(self), l)
+
+    # --- Access ---
+
+    def first(self) -> A:
+        """
+        >>> ChunkedList.of(1, 2, 3).first()
+        1
+        """
+        if type(self) is Chunk:
+            return self.values[0]
+        else:
+            raise UnexpectedNilError("Cannot call `first()` on `ChunkedNil`")
+
+    def take_first(self, n: int) -> ChunkedList[A]:
+        """
+        >>> ChunkedList.of(1, 2, 3).take_first(2)
+        ChunkedList(1, 2)
+        """
+        assert n >= 1
+        remaining = n
+        taken = []
+        for values in _chunks(self):
+            taken.append(values[:remaining])
+            remaining -= len(values)
+            if remaining <= 0:
+                return _link(taken)
+        raise UnexpectedNilError("Cannot call `take_first()` on `ChunkedNil`")
+
+    def drop_first(self, n: int = 1) -> ChunkedList[A]:
+        """
+        >>> ChunkedList.of(1, 2, 3).drop_first(2)
+        ChunkedList(3)
+        """
+        assert n >= 1
+        node: ChunkedList[A] = self
+        while type(node) is Chunk:
+            if n < len(node.values):
+                return Chunk(node.values[n:], node.following)
+            n -= len(node.values)
+            node = node.following
+            if n == 0:
+                return node
+        raise UnexpectedNilError("Cannot call `drop_first()` on `ChunkedNil`")
+
+    def split_first(self) -> tuple[A, ChunkedList[A]]:
+        """
+        >>> ChunkedList.of(1, 2, 3).split_first()
+        (1, ChunkedList(2, 3))
+        """
+        if type(self) is Chunk:
+            return self.first(), self.drop_first()
+        else:
+            raise UnexpectedNilError("Cannot call `split_first()` on `ChunkedNil`")
+
+    def chunk_sizes(self) -> tuple[int, ...]:
+        """
+        Lengths of the underlying chunks, front to back.
+        """
+        return tuple(len(values) for values in _chunks(self))
+
+    # --- Modifiers ---
+
+    def reverse(self) -> ChunkedList[A]:
+        """
+        >>> ChunkedList.of(1, 2, 3).reverse()
+        ChunkedList(3, 2, 1)
+        """
+        reversed_list: ChunkedList[A] = ChunkedNil
+        for values in _chunks(self):
+            reversed_list = Chunk(values[::-1], reversed_list)
+        return reversed_list
+
+    def filter(self, f: Callable[[A], bool]) -> ChunkedList[A]:
+        """
+        The surviving elements are re-packed into full chunks.
+
+        >>> ChunkedList.of(1, 2, 3, 4).filter(lambda x: x % 2 == 0)
+        ChunkedList(2, 4)
+        >>> ChunkedList.from_iter(range(100)).filter(lambda x: x % 3 != 0).chunk_sizes()
+        (32, 32, 2)
+        """
+        return _build(filter(f, _values(self)))
+
+    def filter_not(self, f: Callable[[A], bool]) -> ChunkedList[A]:
+        return self.filter(lambda x: not f(x))
+
+    def intercalate(self, a: A) -> ChunkedList[A]:
+        """
+        >>> ChunkedList.of(1, 2, 3).intercalate(0)
+        ChunkedList(1, 0, 2, 0, 3)
+        """
+        values = _values(self)
+        return _build(
+            chain(islice(values, 1), (value for elem in values for value in (a, elem)))
+        )
+
+
+@final
+class ChunkedNilType(ChunkedList[A], Singleton):
+    __slots__ = ()
+
+    def __reduce__(self) -> str:
+        """Pickled by reference, so unpickling gives back the same `ChunkedNil`."""
+        return "ChunkedNil"
+
+    def __repr__(self) -> str:
+        """
+        >>> ChunkedNilType()
+        ChunkedNil
+        """
+        return "ChunkedNil"
+
+
+ChunkedNil: ChunkedNilType = ChunkedNilType()
+
+
+@final
+class Chunk(ChunkedList[A], Frozen):
+    """
+    A node holding a non-empty tuple of `values`.
+
+    Equality and hashing are by element, so the chunk layout doesn't matter.
+
+    >>> ChunkedList.of(1, 2).prepend(0) == ChunkedList.of(0, 1, 2)
+    True
+    """
+
+    __slots__ = ("values", "following")
+
+    values: tuple[A, ...]
+    following: ChunkedList[A]
+
+    def __init__(
+        self, values: tuple[A, ...], following: ChunkedList[A] = ChunkedNil
+    ) -> None:
+        object.__setattr__(self, "values", values)
+        object.__setattr__(self, "following", following)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return _equal(self, other)  # type: ignore[arg-type]
+
+    def __hash__(self) -> int:
+        return hash(tuple(_values(self)))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (ChunkedList.from_iter, (tuple(_values(self)),))
+
+    def __repr__(self) -> str:
+        return f"ChunkedList({', '.join(map(repr, _values(self)))})"
+
+
+# --- Iterative helpers ---
+
+
+def _chunks(lst: ChunkedList[T]) -> Iterator[tuple[T, ...]]:
+    node = lst
+    while type(node) is Chunk:
+        yield node.values
+        node = node.following
+
+
+def _values(lst: ChunkedList[T]) -> Iterator[T]:
+    return chain.from_iterable(_chunks(lst))
+
+
+def _flat_map_values(
+    lst: ChunkedList[T], f: Callable[[T], ChunkedList[B]]
+) -> Iterator[B]:
+    for value in _values(lst):
+        result = f(value)
+        if type(result) is not Chunk and type(result) is not ChunkedNilType:
+            raise TypeError(
+                f"Expected `f` to return a ChunkedList, got {type(result).__name__}"
+            )
+        yield from _values(result)
+
+
+def _equal(a: ChunkedList[Any], b: ChunkedList[Any]) -> bool:
+    missing = object()
+    values_a = chain(_values(a), (missing,))
+    values_b = chain(_values(b), (missing,))
+    return all(x is y or x == y for x, y in zip(values_a, values_b))
+
+
+def _link(
+    chunks: Iterable[tuple[T, ...]], tail: ChunkedList[T] = ChunkedNil
+) -> ChunkedList[T]:
+    """
+    Links `chunks` front-to-back in a single pass, ending in `tail`, by patching the
+    `following` field of each new node (see `catepyller.data.list._build`).
+
+    Empty chunks are skipped.
+    """
+    head: ChunkedList[T] = tail
+    last: Chunk[T] | None = None
+    for values in chunks:
+        if not values:
+            continue
+        chunk = Chunk(values, tail)
+        if last is None:
+            head = chunk
+        else:
+            object.__setattr__(last, "following", chunk)
+        last = chunk
+    return head
+
+
+def _build(iterable: Iterable[T], tail: ChunkedList[T] = ChunkedNil) -> ChunkedList[T]:
+    iterator = iter(iterable)
+    return _link(iter(lambda: tuple(islice(iterator, CHUNK_SIZE)), ()), tail)
@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import itertools
+from itertools import chain, islice
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar, final
+
+from catepyller.data.list import List, UnexpectedNilError
+from catepyller.protocols import Monad
+from catepyller.protocols.has_empty import SupportsEmpty
+from catepyller.util import Frozen, Singleton
+
+A = TypeVar("A")
+B = TypeVar("B", contravariant=True)
+
+T = TypeVar("T")
+
+
+class LazyList(Monad[A], SupportsEmpty[A]):
+    """
+    Persistent list whose tail is only computed (once) when it is first needed, so it
+    can represent huge or infinite sequences.
+
+    The head of each cell is strict: creating a non-empty `LazyList` (e.g. with
+    `from_iter` or `filter`) pulls its first element straight away, the rest only as
+    the list is walked. Cells that have been computed are memoized, so walking the same
+    `LazyList` twice doesn't re-run anything, and cells that are no longer referenced
+    can be garbage-collected while walking.
+
+    >>> squares = LazyList.count().map(lambda x: x * x)
+    >>> squares.filter(lambda x: x % 3 == 0).take_first(4).to_list()
+    0 :: 9 :: 36 :: 81 :: Nil
+    >>> squares
+    LazyList(0, 1, 4, 9, 16, 25, 36, 49, 64, 81, ...)
+    """
+
+    __slots__ = ()
+
+    # === STATIC ===
+
+    @staticmethod
+    def of(head: T, *args: T) -> LazyCons[T]:
+        """
+        >>> LazyList.of(1, 2, 3).to_list()
+        1 :: 2 :: 3 :: Nil
+        """
+        return LazyCons(head, iter(args))
+
+    @staticmethod
+    def from_iter(iterable: Iterable[T]) -> LazyList[T]:
+        """
+        Only pulls the first element of `iterable` up front.
+
+        >>> def numbers():
+        ...     for x in range(3):
+        ...         print("pulled", x)
+        ...         yield x
+        >>> numbers = LazyList.from_iter(numbers())
+        pulled 0
+        >>> numbers.drop_first(1).first()
+        pulled 1
+        1
+        >>> numbers.to_list()
+        pulled 2
+        0 :: 1 :: 2 :: Nil
+        """
+        return _from_iterator(iter(iterable))
+
+    @staticmethod
+    def empty() -> LazyList[Any]:
+        """
+        >>> LazyList.empty()
+        LazyNil
+        """
+        return LazyNil
+
+    @staticmethod
+    def pure(value: T) -> Any[T]:
+        """
+        >>> LazyList.pure(1)
+        LazyList(1)
+        """
+        return LazyCons(value, LazyNil)
+
+    # --- Create ---
+
+    @staticmethod
+    def count(start: int = 0, step: int = 1) -> LazyList[int]:
+        """
+        >>> LazyList.count(10, 5).take_first(3).to_list()
+        10 :: 15 :: 20 :: Nil
+        """
+        return _from_iterator(itertools.count(start, step))
+
+    @staticmethod
+    def cycle(iterable: Iterable[T]) -> LazyList[T]:
+        """
+        >>> LazyList.cycle([1, 2]).take_first(5).to_list()
+        1 :: 2 :: 1 :: 2 :: 1 :: Nil
+        """
+        return _from_iterator(itertools.cycle(iterable))
+
+    @staticmethod
+    def repeat(value: T, times: Optional[int] = None) -> LazyList[T]:
+        """
+        >>> LazyList.repeat("a", 3).to_list()
+        a :: a :: a :: Nil
+        >>> LazyList.repeat("a").take_first(2).to_list()
+        a :: a :: Nil
+        """
+        if times is None:
+            return _from_iterator(itertools.repeat(value))
+        return _from_iterator(itertools.repeat(value, times))
+
+    @staticmethod
+    def repeatedly(f: Callable[[], T], times: Optional[int] = None) -> LazyList[T]:
+        """
+        Calls `f` once per element, as the list is walked.
+
+        >>> counter = itertools.count()
+        >>> LazyList.repeatedly(lambda: next(counter), 3).to_list()
+        0 :: 1 :: 2 :: Nil
+        """
+        calls = (
+            itertools.repeat(None) if times is None else itertools.repeat(None, times)
+        )
+        return _from_iterator(f() for _ in calls)
+
+    @staticmethod
+    def iterate(f: Callable[[T], T], initial: T) -> LazyList[T]:
+        """
+        `initial`, `f(initial)`, `f(f(initial))`, ...
+
+        >>> LazyList.iterate(lambda x: x * 2, 1).take_first(5).to_list()
+        1 :: 2 :: 4 :: 8 :: 16 :: Nil
+        """
+        values = itertools.accumulate(
+            itertools.repeat(None), lambda x, _: f(x), initial=initial
+        )
+        return _from_iterator(values)
+
+    # === INSTANCE ===
+
+    # --- `Monad` methods ---
+
+    def flat_map(self, f: Callable[[A], LazyList[B]]) -> LazyList[B]:
+        """
+        >>> LazyList.count(1).flat_map(lambda x: LazyList.repeat(x, x)).take_first(6).to_list()
+        1 :: 2 :: 2 :: 3 :: 3 :: 3 :: Nil
+        """
+        return _from_iterator(chain.from_iterable(map(f, _values(self))))
+
+    def map(self, f: Callable[[A], B]) -> LazyList[B]:
+        """
+        >>> LazyList.count().map(str).take_first(2).to_list()
+        0 :: 1 :: Nil
+        """
+        return _from_iterator(map(f, _values(self)))
+
+    def apply(self, f: LazyList[Callable[[A], B]]) -> LazyList[B]:
+        return super().apply(f)
+
+    # --- Construct new lists ---
+
+    def prepend(self, value: A) -> LazyList[A]:
+        """
+        >>> LazyList.count(1).prepend(0).take_first(3).to_list()
+        0 :: 1 :: 2 :: Nil
+        """
+        return LazyCons(value, self)
+
+    def extend(self, l: LazyList[A]) -> LazyList[A]:
+        """
+        >>> LazyList.of(1, 2).extend(LazyList.count(3)).take_first(4).to_list()
+        1 :: 2 :: 3 :: 4 :: Nil
+        """
+        return _from_iterator(chain(_values(self), _values(l)))
+
+    # --- Access ---
+
+    def first(self) -> A:
+        """
+        >>> LazyList.count(5).first()
+        5
+        """
+        if type(self) is LazyCons:
+            return self.value
+        else:
+            raise UnexpectedNilError("Cannot call `first()` on `LazyNil`")
+
+    def take_first(self, n: int) -> LazyList[A]:
+        """
+        Unlike `List.take_first` this is lazy, so a list shorter than `n` is truncated
+        rather than raising.
+
+        >>> LazyList.of(1, 2).take_first(5).to_list()
+        1 :: 2 :: Nil
+        """
+        assert n >= 1
+        return _from_iterator(islice(_values(self), n))
+
+    def drop_first(self, n: int = 1) -> LazyList[A]:
+        """
+        Walks (and computes) the first `n` cells.
+
+        >>> LazyList.count().drop_first(5).first()
+        5
+        """
+        assert n >= 1
+        node: LazyList[A] = self
+        for _ in range(n):
+            if type(node) is not LazyCons:
+                raise UnexpectedNilError("Cannot call `drop_first()` on `LazyNil`")
+            node = node.following
+        return node
+
+    def split_first(self) -> tuple[A, LazyList[A]]:
+        """
+        >>> LazyList.of(1, 2, 3).split_first()
+        (1, LazyList(2, ...))
+        """
+        if type(self) is LazyCons:
+            return self.value, self.following
+        else:
+            raise UnexpectedNilError("Cannot call `split_first()` on `LazyNil`")
+
+    # --- Modifiers ---
+
+    def filter(self, f: Callable[[A], bool]) -> LazyList[A]:
+        """
+        >>> LazyList.count().filter(lambda x: x % 7 == 0).take_first(3).to_list()
+        0 :: 7 :: 14 :: Nil
+        """
+        return _from_iterator(filter(f, _values(self)))
+
+    def filter_not(self, f: Callable[[A], bool]) -> LazyList[A]:
+        return self.filter(lambda x: not f(x))
+
+    # --- Chunks and windows ---
+
+    # Each chunk or window is a strict `List`, computed (along with the cells it covers)
+    # as the result is walked, so walking an unbounded list holds one window at a time
+
+    def chunks_of(self, n: int, drop_remainder: bool = False) -> LazyList[List[A]]:
+        """
+        >>> LazyList.count().chunks_of(3).drop_first(2).first()
+        6 :: 7 :: 8 :: Nil
+        """
+        from catepyller.functions.windows import chunks_of
+
+        chunks = chunks_of(_values(self), n, drop_remainder)
+        return _from_iterator(map(List.from_iter, chunks))
+
+    def window(
+        self, size: int, step: int = 1, drop_remainder: bool = False
+    ) -> LazyList[List[A]]:
+        """
+        See `List.window`.
+
+        >>> readings = LazyList.count().map(lambda t: t % 10)
+        >>> readings.window(4, step=2).map(max).take_first(5).to_list()
+        3 :: 5 :: 7 :: 9 :: 9 :: Nil
+        """
+        from catepyller.functions.windows import window
+
+        windows = window(_values(self), size, step, drop_remainder)
+        return _from_iterator(map(List.from_iter, windows))
+
+    def partition_by(self, f: Callable[[A], Any]) -> LazyList[List[A]]:
+        """
+        >>> runs = LazyList.count().partition_by(lambda x: x // 3)
+        >>> runs.map(List.to_pylist).take_first(2).to_list()
+        [0, 1, 2] :: [3, 4, 5] :: Nil
+        """
+        from catepyller.functions.windows import partition_by
+
+        return _from_iterator(map(List.from_iter, partition_by(_values(self), f)))
+
+    # --- Convert ---
+
+    def __iter__(self) -> Iterator[A]:
+        """
+        Streams the values without holding on to `self`, so the cells already walked
+        can be freed if nothing else references them.
+
+        >>> sum(LazyList.count().take_first(10))
+        45
+        """
+        return _values(self)
+
+    def to_list(self) -> List[A]:
+        """
+        Computes the whole list, so it must be finite.
+        """
+        return List.from_iter(_values(self))
+
+
+@final
+class LazyNilType(LazyList[A], Singleton):
+    __slots__ = ()
+
+    def __reduce__(self) -> str:
+        """Pickled by reference, so unpickling gives back the same `LazyNil`."""
+        return "LazyNil"
+
+    def __repr__(self) -> str:
+        """
+        >>> LazyNilType()
+        LazyNil
+        """
+        return "LazyNil"
+
+
+LazyNil: LazyNilType = LazyNilType()
+
+
+@final
+class LazyCons(LazyList[A], Frozen):
+    """
+    A cell with a strict `value` and a lazy `following`. Until it is needed, the tail is
+    kept as the iterator (`_rest`) that will produce it.
+
+    If producing the tail raises, the iterator can't be trusted to resume where it
+    was, so the exception is kept in `_rest` instead and raised again on every later
+    access: the list never changes its contents.
+
+    >>> LazyCons(1, [2, 3]).to_list()
+    1 :: 2 :: 3 :: Nil
+    >>> numbers = LazyList.from_iter(1 // x for x in [1, 0, 2])
+    >>> numbers.following
+    Traceback (most recent call last):
+    ...
+    ZeroDivisionError: integer division or modulo by zero
+    >>> numbers.following
+    Traceback (most recent call last):
+    ...
+    ZeroDivisionError: integer division or modulo by zero
+    """
+
+    __slots__ = ("value", "_following", "_rest")
+
+    value: A
+    _following: LazyList[A]
+    _rest: Optional[Iterator[A] | Exception]  # The exception producing it raised
+
+    def __init__(self, value: A, following: LazyList[A] | Iterable[A]) -> None:
+        object.__setattr__(self, "value", value)
+        if type(following) is LazyCons or following is LazyNil:
+            object.__setattr__(self, "_following", following)
+            object.__setattr__(self, "_rest", None)
+        else:
+            object.__setattr__(self, "_rest", iter(following))
+
+    @property
+    def following(self) -> LazyList[A]:
+        rest = self._rest
+        if rest is not None:
+            if isinstance(rest, Exception):
+                raise rest
+            try:
+                following = _from_iterator(rest)
+            except Exception as e:
+                object.__setattr__(self, "_rest", e)
+                raise
+            object.__setattr__(self, "_following", following)
+            object.__setattr__(self, "_rest", None)
+        return self._following
+
+    def __repr__(self) -> str:
+        """
+        Only shows the cells that have already been computed.
+
+        >>> LazyList.of(1, 2, 3)
+        LazyList(1, ...)
+        """
+        shown = []
+        node: LazyList[A] = self
+        while type(node) is LazyCons:
+            shown.append(repr(node.value))
+            if node._rest is not None:
+                shown.append("...")
+                break
+            node = node._following
+        return f"LazyList({', '.join(shown)})"
+
+
+# --- Iterative helpers ---
+
+
+def _from_iterator(iterator: Iterator[T]) -> LazyList[T]:
+    for value in iterator:
+        return LazyCons(value, iterator)
+    return LazyNil
+
+
+def _values(lst: LazyList[T]) -> Iterator[T]:
+    node = lst
+    del lst
+    while type(node) is LazyCons:
+        yield node.value
+        node = node.following
@@ -1,27 +1,50 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Callable, Iterable, TypeVar, final
+import heapq
+import typing
+from collections import Counter
+from functools import partial, reduce
+from itertools import islice
+from operator import add
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+    final,
+)
 
 from catepyller.data.option import Nothing, Option, Some
-from catepyller.protocols import Monad
+from catepyller.protocols import Foldable, Monad
 from catepyller.protocols.has_empty import SupportsEmpty
-from catepyller.util import Singleton, SupportsComparison
+from catepyller.protocols.parallel import SupportsParallel
+from catepyller.util import Frozen, Singleton, SupportsComparison
+
+if TYPE_CHECKING:
+    from catepyller.data.result import Result
+    from catepyller.data.view import View
 
 A = TypeVar("A")
 B = TypeVar("B", contravariant=True)
 
 T = TypeVar("T")
-C = TypeVar("C", bound=SupportsComparison)
+K = TypeVar("K")
+E = TypeVar("E")
 
 
 class UnexpectedNilError(ValueError):
     pass
 
 
-class List(Monad[A], SupportsEmpty[A]):
+class List(Monad[A], Foldable[A], SupportsEmpty[A], SupportsParallel[A]):
     # TODO: Should this conform to Sequence[A] ? or maybe just Iterable[A]
 
+    __slots__ = ()
+
     # === STATIC ===
 
     @staticmethod
@@ -35,11 +58,21 @@ class List(Monad[A], SupportsEmpty[A]):
     @staticmethod
     def from_iter(iterable: Iterable[T]) -> List[T]:
         """
+        Sequences (`list`, `tuple`, `range`, ...) are read backwards in place, other
+        iterables are buffered once first. A `List` is returned as is.
+
         >>> List.from_iter([1, 2, 3])
         1 :: 2 :: 3 :: Nil
+        >>> List.from_iter(x for x in "ab")
+        a :: b :: Nil
         """
+        if type(iterable) is Elem or type(iterable) is NilType:
+            return iterable  # type: ignore[return-value]
+        if not isinstance(iterable, typing.Sequence):
+            iterable = list(iterable)
+
         new_list: List = Nil
-        for elem in reversed(list(iterable)):
+        for elem in reversed(iterable):
             new_list = Elem(elem, new_list)
 
         return new_list
@@ -61,43 +94,108 @@ class List(Monad[A], SupportsEmpty[A]):
         return List.of(value)
 
     @staticmethod
-    def sorted(lst: List[C]) -> List[C]:
-        raise NotImplementedError
+    def sorted(
+        lst: List[T],
+        key: Optional[Callable[[T], SupportsComparison]] = None,
+        reverse: bool = False,
+    ) -> List[T]:
+        """
+        Stable, like the built-in `sorted`, which does the sorting: its merge sort (in
+        C) over a buffer of the values beats merging the cells in Python by far, and the
+        sorted values are then linked into a new list back to front.
+
+        >>> List.sorted(List.of(3, 1, 2))
+        1 :: 2 :: 3 :: Nil
+        >>> List.sorted(List.of("b", "A", "a"), key=str.lower, reverse=True)
+        b :: A :: a :: Nil
+        """
+        return List.from_iter(
+            sorted(_values(lst), key=key, reverse=reverse)  # type: ignore[type-var, arg-type]
+        )
 
     # === INSTANCE ===
 
     # --- `Monad` methods ---
 
     def flat_map(self, f: Callable[[A], List[B]]) -> List[B]:
-        if isinstance(self, Elem):
-            return f(self.value).extend(self.following.flat_map(f))
-        else:
-            return Nil
+        """
+        >>> List.of(1, 2).flat_map(lambda x: List.of(x, x * 10))
+        1 :: 10 :: 2 :: 20 :: Nil
+        >>> List.of(1, 2).flat_map(lambda x: [x])
+        Traceback (most recent call last):
+        ...
+        TypeError: Expected `f` to return a List, got list
+        """
+        return _build(_flat_map_values(self, f))
 
     def map(self, f: Callable[[A], B]) -> List[B]:
-        return super().map(f)
+        """
+        >>> List.of(1, 2, 3).map(lambda x: x * 2)
+        2 :: 4 :: 6 :: Nil
+        """
+        return _build(map(f, _values(self)), size=self.length)
 
     def apply(self, f: List[Callable[[A], B]]) -> List[B]:
-        return super().apply(f)
+        """
+        Every function applied to every element, in O(n·m).
+
+        >>> List.of(1, 2).apply(List.of(lambda x: x + 1, lambda x: x * 10))
+        2 :: 3 :: 10 :: 20 :: Nil
+        """
+        values = tuple(_values(self))
+        return _build(
+            (g(value) for g in _values(f) for value in values),
+            size=len(values) * f.length,
+        )
+
+    def product(self, fb: List[T]) -> List[tuple[A, T]]:
+        """
+        >>> List.of(1, 2).product(List.of("a", "b"))
+        (1, 'a') :: (1, 'b') :: (2, 'a') :: (2, 'b') :: Nil
+        """
+        others = tuple(_values(fb))
+        return _build(
+            ((value, other) for value in _values(self) for other in others),
+            size=self.length * len(others),
+        )
 
     # ---
 
-    # >>> Not O(1) :(
+    # --- Size ---
+
+    # Every `Elem` stores the length of the list starting at it (and `Nil` has length
+    # 0), so `length` is O(1) and out-of-range indexes can be rejected up front
 
-    # @property
-    # def length(self) -> int:
-    #     if isinstance(self, Elem):
-    #         return 1 + self.following.length
-    #     else:
-    #         return 0
+    length: int
 
-    # def get(self, index: int) -> Option[A]:
-    #     if isinstance(self, Elem):
-    #         return Some(self.value) if index == 0 else self.following.get(index - 1)
-    #     else:
-    #         return Nothing
+    def __len__(self) -> int:
+        """
+        >>> len(List.of(1, 2, 3))
+        3
+        >>> len(Nil)
+        0
+        """
+        return self.length
 
-    # <<<
+    def get(self, index: int) -> Option[A]:
+        """
+        Negative indexes count from the end.
+
+        >>> List.of(1, 2, 3).get(1)
+        Some(2)
+        >>> List.of(1, 2, 3).get(-1)
+        Some(3)
+        >>> List.of(1, 2, 3).get(3)
+        Nothing
+        """
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            return Nothing
+        node: List[A] = self
+        for _ in range(index):
+            node = node.following  # type: ignore[attr-defined]
+        return Some(node.value)  # type: ignore[attr-defined]
 
     # --- Construct new lists ---
 
@@ -106,20 +204,14 @@ class List(Monad[A], SupportsEmpty[A]):
         >>> List.of(1,2,3).prepend(0)
         0 :: 1 :: 2 :: 3 :: Nil
         """
-        if isinstance(self, Elem):
-            return Elem(value, self)
-        else:
-            return Elem(value)
+        return Elem(value, self)
 
     def extend(self, l: List[A]) -> List[A]:
         """
         >>> List.of(1,2,3).extend(List.of(4,5))
         1 :: 2 :: 3 :: 4 :: 5 :: Nil
         """
-        if isinstance(self, Elem):
-            return Elem(self.value, self.following.extend(l))
-        else:
-            return l
+        return _build(_values(self), l, size=self.length)
 
     # --- Access ---
 
@@ -128,7 +220,7 @@ class List(Monad[A], SupportsEmpty[A]):
         >>> List.of(1,2,3).first()
         1
         """
-        if isinstance(self, Elem):
+        if type(self) is Elem:
             return self.value
         else:
             raise UnexpectedNilError("Cannot call `first()` on `Nil`")
@@ -139,14 +231,9 @@ class List(Monad[A], SupportsEmpty[A]):
         1 :: 2 :: Nil
         """
         assert n >= 1
-        if isinstance(self, Elem):
-            return (
-                Elem(self.value)
-                if n == 1
-                else Elem(self.value, self.following.take_first(n - 1))
-            )
-        else:
+        if n > self.length:
             raise UnexpectedNilError("Cannot call `take_first()` on `Nil`")
+        return _build(islice(_values(self), n), size=n)
 
     def drop_first(self, n: int = 1) -> List[A]:
         """
@@ -154,116 +241,477 @@ class List(Monad[A], SupportsEmpty[A]):
         3 :: Nil
         """
         assert n >= 1
-        if isinstance(self, Elem):
-            return self.following if n == 1 else self.following.drop_first(n - 1)
-        else:
+        if n > self.length:
             raise UnexpectedNilError("Cannot call `drop_first()` on `Nil`")
+        node: List[A] = self
+        for _ in range(n):
+            node = node.following  # type: ignore[attr-defined]
+        return node
 
     def split_first(self) -> tuple[A, List[A]]:
         """
         >>> List.of(1,2,3).split_first()
         (1, 2 :: 3 :: Nil)
         """
-        if isinstance(self, Elem):
-            return self.first(), self.drop_first()
+        if type(self) is Elem:
+            return self.value, self.following
         else:
             raise UnexpectedNilError("Cannot call `split_first()` on `Nil`")
 
-    # >>> Not O(1) :(
-
-    # def last(self) -> A:
-    #     """
-    #     >>> List.of(1,2,3).last()
-    #     3
-    #     """
-    #     if isinstance(self, Elem):
-    #         return self.value if self.following is Nil else self.following.last()
-    #     else:
-    #         raise UnexpectedNilError("Cannot call `last()` on `Nil`")
-
-    # def take_last(self, n: int = 1) -> List[A]:
-    #     """
-    #     >>> List.of(1,2,3).take_last(2)
-    #     2 :: 3 :: Nil
-    #     """
-    #     # TODO: Error handling
-    #     assert n >= 1
-    #     return self.take_first(self.length - n)
-
-    # def drop_last(self, n: int = 1) -> List[A]:
-    #     ...  # TODO
+    # NOTE: These walk the list, so are O(n) despite the known length
+
+    def last(self) -> A:
+        """
+        >>> List.of(1,2,3).last()
+        3
+        """
+        if type(self) is Elem:
+            return self.take_last(1).first()
+        else:
+            raise UnexpectedNilError("Cannot call `last()` on `Nil`")
+
+    def take_last(self, n: int = 1) -> List[A]:
+        """
+        Shares the last `n` cells rather than copying them.
+
+        >>> List.of(1,2,3).take_last(2)
+        2 :: 3 :: Nil
+        """
+        assert n >= 1
+        if n > self.length:
+            raise UnexpectedNilError("Cannot call `take_last()` on `Nil`")
+        return self if n == self.length else self.drop_first(self.length - n)
+
+    def drop_last(self, n: int = 1) -> List[A]:
+        """
+        >>> List.of(1,2,3).drop_last(2)
+        1 :: Nil
+        """
+        assert n >= 1
+        if n > self.length:
+            raise UnexpectedNilError("Cannot call `drop_last()` on `Nil`")
+        return Nil if n == self.length else self.take_first(self.length - n)
 
     # def split_last(self) -> Option[tuple[List[A], A]]:
     #     ...  # TODO
 
-    # <<<
-
     # --- Modifiers ---
 
     def _reverse(self, accumulated: List[A]) -> List[A]:
-        if isinstance(self, Elem):
-            return self.following._reverse(Elem(self.value, accumulated))
-        else:
-            return accumulated
+        for value in _values(self):
+            accumulated = Elem(value, accumulated)
+        return accumulated
 
     def reverse(self) -> List[A]:
+        """
+        >>> List.of(1,2,3).reverse()
+        3 :: 2 :: 1 :: Nil
+        """
         # TODO: Should this be past tense...?
         return self._reverse(Nil)
 
-    # def split_at(self, n: int) -> tuple[List[A], List[A]]:
-    #     ...  # TODO
+    def split_at(self, n: int) -> tuple[List[A], List[A]]:
+        """
+        The first `n` elements, and the rest (which is shared, not copied).
+
+        >>> List.of(1,2,3).split_at(1)
+        (1 :: Nil, 2 :: 3 :: Nil)
+        >>> List.of(1,2,3).split_at(3)
+        (1 :: 2 :: 3 :: Nil, Nil)
+        >>> List.of(1,2,3).split_at(4)
+        Traceback (most recent call last):
+        ...
+        catepyller.data.list.UnexpectedNilError: Cannot split a list of length 3 at 4
+        """
+        if not 0 <= n <= self.length:
+            raise UnexpectedNilError(
+                f"Cannot split a list of length {self.length} at {n}"
+            )
+        if n == 0:
+            return Nil, self
+        return _build(islice(_values(self), n), size=n), self.drop_first(n)
 
     def filter(self, f: Callable[[A], bool]) -> List[A]:
-        if isinstance(self, Elem):
-            if f(self.value):
-                return Elem(self.value, self.following.filter(f))
-            else:
-                return self.following.filter(f)
-        else:
-            return Nil
+        """
+        >>> List.of(1,2,3,4).filter(lambda x: x % 2 == 0)
+        2 :: 4 :: Nil
+        """
+        return _build(filter(f, _values(self)))
 
     def filter_not(self, f: Callable[[A], bool]) -> List[A]:
         return self.filter(lambda x: not f(x))
 
+    # --- Folds ---
+
+    def fold_left(self, initial: T, f: Callable[[T, A], T]) -> T:
+        """
+        >>> List.of(1, 2, 3).fold_left("", lambda acc, x: acc + str(x))
+        '123'
+        """
+        return reduce(f, _values(self), initial)
+
+    def fold_right(self, initial: T, f: Callable[[A, T], T]) -> T:
+        """
+        Walks the list backwards from a copy of its values, since the cells only link
+        forwards.
+
+        >>> List.of(1, 2, 3).fold_right("", lambda x, acc: acc + str(x))
+        '321'
+        """
+        for value in reversed(self.to_tuple()):
+            initial = f(value, initial)
+        return initial
+
+    def fold_map(
+        self, initial: T, f: Callable[[A], T], combine: Callable[[T, T], T] = add
+    ) -> T:
+        """
+        >>> List.of("a", "bc").fold_map(0, len)
+        3
+        >>> List.of(1, 2).fold_map(Nil, lambda x: List.of(x, x), List.extend)
+        1 :: 1 :: 2 :: 2 :: Nil
+        """
+        for value in _values(self):
+            initial = combine(initial, f(value))
+        return initial
+
+    def reduce(self, f: Callable[[T, A], T]) -> Option[A | T]:
+        """
+        >>> List.of(3, 1, 2).reduce(max)
+        Some(3)
+        >>> Nil.reduce(max)
+        Nothing
+        """
+        if type(self) is not Elem:
+            return Nothing
+        return Some(self.following.fold_left(self.value, f))
+
+    # --- Sorting ---
+
+    def sorted_by(
+        self, key: Callable[[A], SupportsComparison], reverse: bool = False
+    ) -> List[A]:
+        """
+        >>> List.of("ccc", "a", "bb").sorted_by(len)
+        a :: bb :: ccc :: Nil
+        """
+        return List.sorted(self, key=key, reverse=reverse)
+
+    def merge(
+        self,
+        other: List[A],
+        key: Optional[Callable[[A], SupportsComparison]] = None,
+        reverse: bool = False,
+    ) -> List[A]:
+        """
+        Merges two lists which are already sorted (by `key`, and descending if
+        `reverse`) into a sorted list, in O(n + m). Ties keep the values from `self`
+        first. Whatever is left of either list once the other runs out is shared, not
+        copied.
+
+        >>> List.of(1, 3, 5).merge(List.of(2, 3, 4, 10, 11))
+        1 :: 2 :: 3 :: 3 :: 4 :: 5 :: 10 :: 11 :: Nil
+        >>> List.of(3, 1).merge(List.of(2), reverse=True)
+        3 :: 2 :: 1 :: Nil
+        """
+        merged = []
+        a, b = self, other
+        if type(a) is Elem and type(b) is Elem:
+            key_a: Any = a.value if key is None else key(a.value)
+            key_b: Any = b.value if key is None else key(b.value)
+            while True:
+                if key_a < key_b if reverse else key_b < key_a:
+                    merged.append(b.value)
+                    b = b.following
+                    if type(b) is not Elem:
+                        break
+                    key_b = b.value if key is None else key(b.value)
+                else:
+                    merged.append(a.value)
+                    a = a.following
+                    if type(a) is not Elem:
+                        break
+                    key_a = a.value if key is None else key(a.value)
+
+        merged_list = a if type(a) is Elem else b
+        for value in reversed(merged):
+            merged_list = Elem(value, merged_list)
+        return merged_list
+
+    def top_k(
+        self, k: int, key: Optional[Callable[[A], SupportsComparison]] = None
+    ) -> List[A]:
+        """
+        The `k` largest values, largest first, keeping a heap of at most `k` values
+        rather than sorting the whole list (O(n log k)).
+
+        >>> List.of(5, 1, 4, 2, 3).top_k(2)
+        5 :: 4 :: Nil
+        >>> List.of("a", "ccc", "bb").top_k(5, key=len)
+        ccc :: bb :: a :: Nil
+        """
+        return List.from_iter(heapq.nlargest(k, _values(self), key=key))
+
+    def smallest_k(
+        self, k: int, key: Optional[Callable[[A], SupportsComparison]] = None
+    ) -> List[A]:
+        """
+        The `k` smallest values, smallest first (see `top_k`).
+
+        >>> List.of(5, 1, 4, 2, 3).smallest_k(2)
+        1 :: 2 :: Nil
+        """
+        return List.from_iter(heapq.nsmallest(k, _values(self), key=key))
+
+    # --- Python protocols ---
+
+    def __iter__(self) -> Iterator[A]:
+        """
+        >>> [x * 2 for x in List.of(1, 2, 3)]
+        [2, 4, 6]
+        """
+        return _values(self)
+
+    def __reversed__(self) -> Iterator[A]:
+        """
+        Needs O(n) extra space, since the cells only link forwards.
+
+        >>> list(reversed(List.of(1, 2, 3)))
+        [3, 2, 1]
+        """
+        return reversed(self.to_tuple())
+
+    def __contains__(self, value: object) -> bool:
+        """
+        >>> 2 in List.of(1, 2, 3)
+        True
+        >>> 4 in List.of(1, 2, 3)
+        False
+        """
+        return value in _values(self)  # type: ignore[operator]
+
+    # --- Convert ---
+
+    def to_pylist(self) -> list[A]:
+        """
+        >>> List.of(1, 2, 3).to_pylist()
+        [1, 2, 3]
+        """
+        return list(_values(self))
+
+    def to_tuple(self) -> tuple[A, ...]:
+        """
+        >>> List.of(1, 2, 3).to_tuple()
+        (1, 2, 3)
+        """
+        return tuple(_values(self))
+
+    def view(self) -> View[A]:
+        """
+        Lazy pipeline over this list which fuses `map`, `filter`, `flat_map`, `take`
+        and `drop` into a single pass (see `View`).
+
+        >>> List.of(1, 2, 3).view().map(lambda x: x + 1).filter(lambda x: x != 3).to_list()
+        2 :: 4 :: Nil
+        """
+        from catepyller.data.view import View
+
+        return View(partial(_values, self), List.from_iter)
+
+    # --- Async ---
+
+    async def map_async(
+        self, f: Callable[[A], Awaitable[T]], limit: Optional[int] = None
+    ) -> List[T]:
+        """
+        Awaits `f` on every element concurrently, at most `limit` at a time, see
+        `catepyller.functions.asynchronous.map_async`.
+        """
+        from catepyller.functions.asynchronous import map_async
+
+        return await map_async(self, f, limit=limit)
+
+    async def traverse_async(
+        self, f: Callable[[A], Awaitable[Result[T, E]]], limit: Optional[int] = None
+    ) -> Result[List[T], E]:
+        """
+        Like `map_async`, but stops at (and returns) the first `Failure`, cancelling
+        the calls still running. See `catepyller.functions.asynchronous.traverse_async`.
+
+        >>> import asyncio
+        >>> from catepyller.data.result import Failure, Success
+        >>> async def check(x):
+        ...     return Success(x) if x > 0 else Failure(f"{x} is not positive")
+        >>> asyncio.run(List.of(1, 2).traverse_async(check))
+        Success(1 :: 2 :: Nil)
+        >>> asyncio.run(List.of(1, -2, -3).traverse_async(check, limit=1))
+        Failure(-2 is not positive)
+        """
+        from catepyller.functions.asynchronous import traverse_async
+
+        return await traverse_async(self, f, limit=limit)
+
     def intercalate(self, a: A) -> List[A]:
-        if isinstance(self, Elem):
-            if isinstance(self.following, Elem):
-                return Elem(self.value, Elem(a, self.intercalate(self.following)))
-            else:
-                return self
-        else:
+        """
+        >>> List.of(1,2,3).intercalate(0)
+        1 :: 0 :: 2 :: 0 :: 3 :: Nil
+        >>> List.of(1).intercalate(0)
+        1 :: Nil
+        """
+        if type(self) is not Elem:
             return Nil
+        return Elem(
+            self.value,
+            _build(
+                (value for elem in _values(self.following) for value in (a, elem)),
+                size=2 * self.following.length,
+            ),
+        )
 
-    # def chunks_of(self, n: int, drop_remainder: bool = False) -> List[A]:
-    #     """
-    #     # >>> [1,2,3,4,5].chunk(2)
-    #     # [[1,2], [3,4], [5]]
-    #     """
-    #     ...  # TODO
+    # --- Chunks and windows ---
 
-    # def split_into(self, n: int) -> List[List[A]]:
-    #     """
-    #     # >>> List.of(1,2,3,4).split_into(2)
-    #     # [[1,2], [3,4]]
+    def chunks_of(self, n: int, drop_remainder: bool = False) -> List[List[A]]:
+        """
+        Consecutive lists of `n` elements, the last one shorter (or left out if
+        `drop_remainder`) if the length isn't a multiple of `n`.
 
-    #     Name based on List.splitInto from F#
-    #     """
-    #     ...  # TODO
+        >>> List.of(1, 2, 3, 4, 5).chunks_of(2).map(List.to_pylist)
+        [1, 2] :: [3, 4] :: [5] :: Nil
+        """
+        from catepyller.functions.windows import chunks_of
 
-    # def window(
-    #     self, size: int, step: int = 1, drop_remainder: bool = False
-    # ) -> List[List[A]]:
-    #     ...  # TODO
+        return List.from_iter(map(List.from_iter, chunks_of(self, n, drop_remainder)))
 
-    # def group_by(self, f: Callable[[A], Any]) -> List[List[A]]:
-    #     ...  # TODO
+    def split_into(self, n: int) -> List[List[A]]:
+        """
+        At most `n` consecutive lists whose lengths differ by at most one, the longer
+        ones first.
+
+        Name based on List.splitInto from F#
 
-    # def partition(self, f: Callable[[A], bool]) -> tuple[List[A], List[A]]:
-    #     return (self.filter(f), self.filter_not(f))
+        >>> List.of(1, 2, 3, 4, 5).split_into(2).map(List.to_pylist)
+        [1, 2, 3] :: [4, 5] :: Nil
+        >>> List.of(1, 2).split_into(3).map(List.to_pylist)
+        [1] :: [2] :: Nil
+        """
+        assert n >= 1
+        size, longer = divmod(self.length, n)
+        values = _values(self)
+        return List.from_iter(
+            _build(islice(values, length), size=length)
+            for length in [size + 1] * longer + [size] * (n - longer)
+            if length > 0
+        )
+
+    def window(
+        self, size: int, step: int = 1, drop_remainder: bool = False
+    ) -> List[List[A]]:
+        """
+        Lists of `size` consecutive elements, starting every `step` elements. If the
+        elements run out before the last full window has covered them all, what is
+        left makes one more, shorter window unless `drop_remainder`. See
+        `catepyller.functions.windows.window`.
+
+        >>> List.of(1, 2, 3, 4).window(2).map(List.to_pylist)
+        [1, 2] :: [2, 3] :: [3, 4] :: Nil
+        >>> List.of(1, 2, 3, 4).window(3, step=2).map(List.to_pylist)
+        [1, 2, 3] :: [3, 4] :: Nil
+        """
+        from catepyller.functions.windows import window
+
+        windows = window(self, size, step, drop_remainder)
+        return List.from_iter(map(List.from_iter, windows))
+
+    def partition_by(self, f: Callable[[A], Any]) -> List[List[A]]:
+        """
+        Runs of consecutive elements for which `f` gives the same value.
+
+        >>> List.of(1, 3, 2, 4, 5).partition_by(lambda x: x % 2).map(List.to_pylist)
+        [1, 3] :: [2, 4] :: [5] :: Nil
+        """
+        from catepyller.functions.windows import partition_by
+
+        return List.from_iter(map(List.from_iter, partition_by(self, f)))
+
+    # --- Grouping ---
+
+    # Each of these makes a single pass over the cells, indexing by hash as it goes
+
+    def group_by(self, f: Callable[[A], K]) -> dict[K, List[A]]:
+        """
+        The elements grouped by the key `f` gives them. Keys are in order of first
+        appearance, and each group keeps the order of its elements.
+
+        >>> List.of("apple", "bean", "avocado", "beet").group_by(lambda s: s[0])
+        {'a': apple :: avocado :: Nil, 'b': bean :: beet :: Nil}
+        """
+        groups: dict[K, list[A]] = {}
+        for value in _values(self):
+            key = f(value)
+            try:
+                groups[key].append(value)
+            except KeyError:
+                groups[key] = [value]
+        return {key: List.from_iter(values) for key, values in groups.items()}
+
+    def count_by(self, f: Callable[[A], K]) -> dict[K, int]:
+        """
+        How many elements `f` gives each key, in order of first appearance.
+
+        >>> List.of("apple", "bean", "avocado").count_by(lambda s: s[0])
+        {'a': 2, 'b': 1}
+        """
+        return dict(Counter(map(f, _values(self))))
+
+    def distinct(self) -> List[A]:
+        """
+        The first occurrence of each element, in order.
+
+        >>> List.of(1, 2, 1, 3, 2).distinct()
+        1 :: 2 :: 3 :: Nil
+        """
+        return List.from_iter(dict.fromkeys(_values(self)))
+
+    def distinct_by(self, f: Callable[[A], Any]) -> List[A]:
+        """
+        The first element with each key `f` gives, in order.
+
+        >>> List.of("apple", "bean", "avocado").distinct_by(lambda s: s[0])
+        apple :: bean :: Nil
+        """
+        seen: set[Any] = set()
+        distinct = []
+        for value in _values(self):
+            key = f(value)
+            if key not in seen:
+                seen.add(key)
+                distinct.append(value)
+        return List.from_iter(distinct)
+
+    def partition(self, f: Callable[[A], bool]) -> tuple[List[A], List[A]]:
+        """
+        The elements which satisfy `f` and those which don't, calling `f` once each.
+
+        >>> List.of(1, 2, 3, 4, 5).partition(lambda x: x % 2 == 0)
+        (2 :: 4 :: Nil, 1 :: 3 :: 5 :: Nil)
+        """
+        matching: list[A] = []
+        rest: list[A] = []
+        for value in _values(self):
+            (matching if f(value) else rest).append(value)
+        return List.from_iter(matching), List.from_iter(rest)
 
 
 @final
 class NilType(List[A], Singleton):
+    __slots__ = ()
+
+    length = 0
+
+    def __reduce__(self) -> str:
+        """Pickled by reference, so unpickling gives back the same `Nil`."""
+        return "Nil"
+
     def __repr__(self) -> str:
         """
         >>> NilType()
@@ -276,14 +724,143 @@ Nil: NilType = NilType()
 
 
 @final
-@dataclass(frozen=True, repr=False)
-class Elem(List[A]):
+class Elem(List[A], Frozen):
+    """
+    A single cons cell. Slotted rather than a dataclass, so each cell holds just its
+    fields with no per-instance `__dict__`.
+
+    Equality and hashing walk the cells in a loop, so they work on lists of any length.
+    Comparing two lists stops as soon as they share a tail. Hashes are not cached, as a
+    slot for them would make every cell bigger: hashing is O(n) each time.
+
+    >>> Elem(1) == Elem(1, Nil)
+    True
+    >>> Elem(1).value = 2
+    Traceback (most recent call last):
+    ...
+    AttributeError: cannot assign to field 'value'
+    >>> {List.of(1, 2): "key"}[List.of(1, 2)]
+    'key'
+    """
+
+    __slots__ = ("value", "following", "length")
+    __match_args__ = ("value", "following")
+
     value: A
-    following: List[A] = Nil
+    following: List[A]
+    length: int
+
+    def __init__(self, value: A, following: List[A] = Nil) -> None:
+        _set_value(self, value)
+        _set_following(self, following)
+        _set_length(self, following.length + 1)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return _equal(self, other)  # type: ignore[arg-type]
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(_values(self)))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Pickles the values as a single flat tuple, rebuilt with a loop, rather than one
+        nested record per cell (which would also recurse once per cell). Tails shared
+        with other lists are copied rather than shared after unpickling.
+
+        >>> import pickle
+        >>> numbers = List.of(1, 2, 3)
+        >>> pickle.loads(pickle.dumps(numbers)) == numbers
+        True
+        >>> pickle.loads(pickle.dumps(Nil)) is Nil
+        True
+        """
+        return (List.from_iter, (tuple(_values(self)),))
 
     def __repr__(self) -> str:
         """
         >>> Elem(1, Nil)
         1 :: Nil
         """
-        return f"{self.value} :: {self.following}"
+        return "".join(f"{value} :: " for value in _values(self)) + "Nil"
+
+
+# The slots' own setters, which skip `Frozen.__setattr__` like `object.__setattr__` but
+# without looking the slot up by name, so building a cell costs less
+_set_value = Elem.__dict__["value"].__set__
+_set_following = Elem.__dict__["following"].__set__
+_set_length = Elem.__dict__["length"].__set__
+
+
+# --- Iterative helpers ---
+
+
+def _values(lst: List[T]) -> Iterator[T]:
+    """
+    Walks the cells of `lst` in a loop rather than recursing on `following`.
+    """
+    node = lst
+    while type(node) is Elem:
+        yield node.value
+        node = node.following
+
+
+def _flat_map_values(lst: List[T], f: Callable[[T], List[B]]) -> Iterator[B]:
+    for value in _values(lst):
+        result = f(value)
+        if type(result) is not Elem and type(result) is not NilType:
+            raise TypeError(
+                f"Expected `f` to return a List, got {type(result).__name__}"
+            )
+        yield from _values(result)
+
+
+def _equal(a: List[T], b: List[T]) -> bool:
+    if a.length != b.length:
+        return False
+
+    # Being the same length, both lists reach `Nil` together (or a shared tail)
+    while a is not b:
+        if a.value is not b.value and a.value != b.value:  # type: ignore[attr-defined]
+            return False
+        a, b = a.following, b.following  # type: ignore[attr-defined]
+    return True
+
+
+def _build(
+    values: Iterable[T], tail: List[T] = Nil, size: int | None = None
+) -> List[T]:
+    """
+    Builds a list front-to-back in a single pass, ending in `tail`.
+
+    Each new cell is linked onto the previous one by patching its (otherwise frozen)
+    `following` field. This is safe because no cell is reachable from outside before
+    the whole list has been built.
+
+    Since cells are created before the ones following them, their `length` is only
+    known up front if `size` (the number of `values`) is given; otherwise it is fixed
+    up in a second pass.
+    """
+    head: List[T] = tail
+    last: Elem[T] | None = None
+    length = tail.length + (size if size is not None else 0)
+    count = 0
+    for value in values:
+        elem = Elem(value, tail)
+        if size is not None:
+            _set_length(elem, length - count)
+        if last is None:
+            head = elem
+        else:
+            _set_following(last, elem)
+        last = elem
+        count += 1
+
+    if size is None:
+        node = head
+        for length in range(count + tail.length, tail.length, -1):
+            _set_length(node, length)
+            node = node.following  # type: ignore[attr-defined]
+
+    return head
@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import math
+import operator
+from functools import reduce
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+from catepyller.data.option import Nothing, Option, Some
+from catepyller.protocols.sequence import Sequence
+from catepyller.util import Frozen
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "`catepyller.data.numeric` requires NumPy, install it with the `numeric` extra"
+        " (`pip install catepyller[numeric]`)"
+    ) from e
+
+A = TypeVar("A")
+B = TypeVar("B")
+
+# Python callables which have an equivalent ufunc, so folds over them can be vectorized
+_UFUNCS: dict[Callable[..., Any], np.ufunc] = {
+    operator.add: np.add,
+    operator.mul: np.multiply,
+    operator.and_: np.bitwise_and,
+    operator.or_: np.bitwise_or,
+    operator.xor: np.bitwise_xor,
+    max: np.maximum,
+    min: np.minimum,
+}
+
+_INT64_MAX = 2**63 - 1
+
+
+class NumericSequence(Sequence[A], Frozen):
+    """
+    Immutable `Sequence` of numbers backed by a (read-only) one-dimensional NumPy
+    array.
+
+    `map` and `filter` first try calling their function once on the whole array, which
+    works for anything built from NumPy operations (`lambda x: x * 2 + 1`,
+    `np.sqrt`, `lambda x: x > 0`, ...). If that fails, or doesn't return an array of
+    the same length, they fall back to calling it on each element. Pass
+    `vectorized=False` to skip the attempt (e.g. for functions with side effects), or
+    `vectorized=True` to make a failure raise instead.
+
+    Elements are returned as Python numbers.
+
+    >>> numbers = NumericSequence.from_iter([3, 1, 2])
+    >>> numbers.map(lambda x: x * 10)
+    NumericSequence([30, 10, 20])
+    >>> numbers.filter(lambda x: x > 1).sum()
+    5
+    >>> numbers.sorted()[::-1]
+    NumericSequence([3, 2, 1])
+    """
+
+    __slots__ = ("_array",)
+
+    _array: np.ndarray
+
+    def __init__(self, array: np.ndarray) -> None:
+        """Prefer `NumericSequence.from_array`, which takes care of read-only-ness."""
+        object.__setattr__(self, "_array", array)
+
+    # === STATIC ===
+
+    @classmethod
+    def from_iter(cls, iterable: Iterable[A]) -> NumericSequence[A]:
+        """
+        >>> NumericSequence.from_iter(range(3))
+        NumericSequence([0, 1, 2])
+        """
+        if isinstance(iterable, np.ndarray):
+            return NumericSequence.from_array(iterable)
+        return NumericSequence.from_array(np.array(list(iterable)), copy=False)
+
+    @staticmethod
+    def from_array(array: np.ndarray, copy: bool = True) -> NumericSequence[Any]:
+        """
+        Wraps a one-dimensional array. Unless `copy=False`, `array` is copied so later
+        writes to it can't change the sequence; either way the sequence's own view is
+        read-only.
+
+        >>> NumericSequence.from_array(np.arange(3.0))
+        NumericSequence([0.0, 1.0, 2.0])
+        """
+        if array.ndim != 1:
+            raise ValueError(f"Expected a one-dimensional array, got {array.ndim}")
+        view = (array.copy() if copy else array).view()
+        view.flags.writeable = False
+        return NumericSequence(view)
+
+    @staticmethod
+    def empty() -> NumericSequence[Any]:
+        """
+        >>> NumericSequence.empty()
+        NumericSequence([])
+        """
+        return NumericSequence.from_array(np.empty(0), copy=False)
+
+    # === INSTANCE ===
+
+    @property
+    def length(self) -> int:
+        return len(self._array)
+
+    def get(self, index: int) -> Option[A]:
+        """
+        >>> NumericSequence.from_iter([1, 2]).get(-1)
+        Some(2)
+        >>> NumericSequence.from_iter([1, 2]).get(2)
+        Nothing
+        """
+        if not -len(self._array) <= index < len(self._array):
+            return Nothing
+        return Some(self._array.item(index))
+
+    def get_unsafe(self, index: int) -> A:
+        return self._array.item(index)
+
+    def get_slice(self, slice: slice) -> Option[NumericSequence[A]]:
+        """
+        Slices share the underlying array rather than copying it.
+
+        >>> NumericSequence.from_iter(range(10))[8:2:-2]
+        NumericSequence([8, 6, 4])
+        """
+        return Some(NumericSequence(self._array[slice]))
+
+    def to_array(self) -> np.ndarray:
+        """The underlying array (read-only, so it can be shared without copying)."""
+        return self._array
+
+    # --- Transform ---
+
+    def map(
+        self, f: Callable[[A], B], vectorized: Optional[bool] = None
+    ) -> NumericSequence[B]:
+        """
+        >>> import math
+        >>> NumericSequence.from_iter([1, 4]).map(np.sqrt)
+        NumericSequence([1.0, 2.0])
+        >>> NumericSequence.from_iter([1, 4]).map(math.sqrt)  # Not vectorizable
+        NumericSequence([1.0, 2.0])
+
+        Integer results which wrapped around are caught by running `f` on the values as
+        floats too, and mapped element by element instead (or raise `OverflowError` if
+        `vectorized`). Functions which don't take floats, like bitwise shifts, can't be
+        checked this way, so they can still wrap around.
+
+        >>> NumericSequence.from_iter([2**40]).map(lambda x: x * x)
+        NumericSequence([1208925819614629174706176])
+        """
+        result = self._vectorized(f, vectorized)
+        if result is not None and _wrapped_around(self._array, result, f):
+            if vectorized:
+                raise OverflowError("The result doesn't fit in the array's integers")
+            result = None
+        if result is None:
+            result = np.array([f(x) for x in self._array.tolist()])
+        return NumericSequence.from_array(result, copy=False)
+
+    def filter(
+        self, f: Callable[[A], bool], vectorized: Optional[bool] = None
+    ) -> NumericSequence[A]:
+        """
+        >>> NumericSequence.from_iter(range(6)).filter(lambda x: x % 2 == 0)
+        NumericSequence([0, 2, 4])
+        >>> NumericSequence.from_iter(range(6)).filter(lambda x: x in {1, 5})
+        NumericSequence([1, 5])
+        """
+        mask = self._vectorized(f, vectorized)
+        if mask is None or mask.dtype != np.bool_:
+            if vectorized:
+                raise TypeError("Expected the filter to return an array of booleans")
+            mask = np.fromiter(
+                map(f, self._array.tolist()), dtype=np.bool_, count=len(self._array)
+            )
+        return NumericSequence.from_array(self._array[mask], copy=False)
+
+    def sorted(self, reverse: bool = False) -> NumericSequence[A]:
+        """
+        Stable sort.
+
+        >>> NumericSequence.from_iter([2.5, -1, 3]).sorted(reverse=True)
+        NumericSequence([3.0, 2.5, -1.0])
+        """
+        result = np.sort(self._array, kind="stable")
+        if reverse:
+            result = result[::-1]
+        return NumericSequence.from_array(result, copy=False)
+
+    # --- Aggregate ---
+
+    def sum(self) -> A:
+        """
+        Exact, like the built-in `sum`: integers whose total could overflow NumPy's
+        64-bit integers are added up as Python `int`s instead. 0 when empty.
+
+        >>> NumericSequence.from_iter(range(10**6)).sum()
+        499999500000
+        >>> NumericSequence.from_iter([2**62, 2**62]).sum()
+        9223372036854775808
+        >>> NumericSequence.empty().sum()
+        0
+        """
+        if len(self._array) == 0:
+            return 0  # type: ignore[return-value]
+        if _may_overflow(self._array, np.add):
+            return sum(self._array.tolist())
+        return self._array.sum().item()
+
+    def fold(self, initial: B, f: Callable[[B, A], B]) -> B:
+        """
+        Uses the matching ufunc's `reduce` when `f` is a NumPy ufunc (`np.add`, ...) or
+        one of `operator.add`, `operator.mul`, `max`, `min`, ...; otherwise calls `f`
+        element by element. Integer sums and products which could overflow NumPy's
+        64-bit integers are also folded element by element, as Python `int`s.
+
+        >>> import operator
+        >>> NumericSequence.from_iter([1, 2, 3]).fold(10, operator.mul)
+        60
+        >>> NumericSequence.from_iter([2**62, 2**62]).fold(0, operator.add)
+        9223372036854775808
+        >>> NumericSequence.from_iter([1, 2, 3]).fold("", lambda acc, x: acc + str(x))
+        '123'
+        """
+        ufunc = f if isinstance(f, np.ufunc) else _UFUNCS.get(f)
+        if (
+            ufunc is not None
+            and len(self._array) > 0
+            and not _may_overflow(self._array, ufunc)
+        ):
+            result = f(initial, ufunc.reduce(self._array).item())
+            return result.item() if isinstance(result, np.generic) else result
+        return reduce(f, self._array.tolist(), initial)
+
+    # --- Python protocols ---
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __iter__(self) -> Iterator[A]:
+        return iter(self._array.tolist())
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return bool(
+            np.array_equal(self._array, other._array)  # type: ignore[attr-defined]
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._array.dtype.str, self._array.tobytes()))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (NumericSequence.from_array, (self._array, False))
+
+    def __repr__(self) -> str:
+        return f"NumericSequence({self._array.tolist()})"
+
+    # --- Internals ---
+
+    def _vectorized(
+        self, f: Callable[[Any], Any], vectorized: Optional[bool]
+    ) -> Optional[np.ndarray]:
+        """
+        `f` applied to the whole array, or `None` if it can't be (and `vectorized`
+        isn't `True`).
+        """
+        if vectorized is False:
+            return None
+        try:
+            result = f(self._array)  # type: ignore[arg-type]
+        except Exception:
+            if vectorized:
+                raise
+            return None
+        if isinstance(result, np.ndarray) and result.shape == self._array.shape:
+            return result
+        if vectorized:
+            raise TypeError(
+                "Expected the function to return an array of the same shape"
+            )
+        return None
+
+
+def _may_overflow(array: np.ndarray, ufunc: np.ufunc) -> bool:
+    """
+    Whether reducing the integer `array` with `np.add` or `np.multiply` could wrap
+    around, going by its largest magnitude (other ufuncs can't overflow).
+    """
+    if array.dtype.kind not in "iu" or ufunc not in (np.add, np.multiply):
+        return False
+    largest = max(abs(int(array.min())), abs(int(array.max())))
+    if ufunc is np.add:
+        return len(array) * largest > _INT64_MAX
+    return largest > 1 and len(array) * math.log2(largest) >= 63
+
+
+def _wrapped_around(
+    array: np.ndarray, result: np.ndarray, f: Callable[..., Any]
+) -> bool:
+    """
+    Whether the integer `result` of `f` on the integer `array` overflowed, going by `f`
+    on the values as floats (`False` if `f` can't take them).
+    """
+    if array.dtype.kind not in "iu" or result.dtype.kind not in "iu":
+        return False
+    try:
+        with np.errstate(all="ignore"):
+            approximate = f(array.astype(np.float64))
+    except Exception:
+        return False
+    bounds = np.iinfo(result.dtype)
+    return bool(
+        np.any((approximate >= float(bounds.max)) | (approximate < float(bounds.min)))
+    )
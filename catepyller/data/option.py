@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, Optional, TypeGuard, TypeVar
+from abc import abstractmethod
+from operator import add
+from typing import Any, Awaitable, Callable, Optional, TypeGuard, TypeVar
 
-from catepyller.protocols import Monad
+from catepyller.data.result import Failure, Result, Success
+from catepyller.protocols import Foldable, Monad
 from catepyller.protocols.has_empty import SupportsEmpty
-from catepyller.util import Singleton, Wrapper
+from catepyller.util import Frozen, Singleton, Wrapper
 
 A = TypeVar("A", covariant=True)
 B = TypeVar("B", contravariant=True)
 
 ValueT = TypeVar("ValueT")
+E = TypeVar("E")
 
 
 class UnexpectedNothingException(Exception):
@@ -23,8 +26,27 @@ def unexpectedNothing(function: str) -> UnexpectedNothingException:
     )
 
 
-class Option(Monad[A], SupportsEmpty[A]):
-    """..."""
+class Option(Monad[A], Foldable[A], SupportsEmpty[A]):
+    """
+    An optional value: either `Some(value)` or `Nothing`.
+
+    Every operation is a method implemented separately by `Some` and `Nothing`, so
+    there are no type checks on the way: on `Some` it costs one method call plus
+    whatever it has to build (the new `Some`), and on `Nothing` it returns `Nothing`
+    straight away without calling the function passed in.
+
+    Targets, per operation: `Some(x).map(f)` within about 5x of `f(x)` behind a `None`
+    check (most of it being the new `Some`), operations on `Nothing` within about 2x of
+    the `None` check on its own, and `unwrap_unsafe` on `Some` no more than a method
+    call (see `python -m benchmarks.suite run --only option`).
+
+    >>> Some(2).filter(lambda x: x > 1).map(lambda x: x * 10).unwrap_or(0)
+    20
+    >>> Nothing.map(lambda x: x * 10).unwrap_or(0)
+    0
+    """
+
+    __slots__ = ()
 
     # === STATIC ===
 
@@ -42,9 +64,11 @@ class Option(Monad[A], SupportsEmpty[A]):
 
     # === INSTANCE ===
 
+    @abstractmethod
     def __bool__(self) -> TypeGuard[Some]:
-        return isinstance(self, Some)
+        ...
 
+    @abstractmethod
     def __len__(self) -> int:
         """
         >>> len(Some("?"))
@@ -52,47 +76,353 @@ class Option(Monad[A], SupportsEmpty[A]):
         >>> len(Nothing)
         0
         """
-        return int(bool(self))
+        ...
 
-    # --- Declare typing for `Monad` methods ---
+    # --- `Monad` methods ---
 
+    @abstractmethod
     def flat_map(self, f: Callable[[A], Option[B]]) -> Option[B]:
-        if isinstance(self, Some):
-            return f(self.value)
-        else:
-            return Nothing
+        """
+        >>> Some(1).flat_map(lambda x: Some(x + 1))
+        Some(2)
+        >>> Nothing.flat_map(lambda x: Some(x + 1))
+        Nothing
+        """
+        ...
 
+    @abstractmethod
     def map(self, f: Callable[[A], B]) -> Option[B]:
-        return super().map(f)
+        """
+        >>> Some(1).map(lambda x: x + 1)
+        Some(2)
+        >>> Nothing.map(lambda x: x + 1)
+        Nothing
+        """
+        ...
 
+    @abstractmethod
     def apply(self, f: Option[Callable[[A], B]]) -> Option[B]:
-        return super().apply(f)
+        """
+        >>> Some(1).apply(Some(lambda x: x + 1))
+        Some(2)
+        >>> Some(1).apply(Nothing)
+        Nothing
+        """
+        ...
+
+    @abstractmethod
+    def product(self, fb: Option[ValueT]) -> Option[tuple[A, ValueT]]:
+        """
+        >>> Some(1).product(Some("a"))
+        Some((1, 'a'))
+        >>> Some(1).product(Nothing)
+        Nothing
+        """
+        ...
+
+    # --- Combinators ---
+
+    def and_then(self, f: Callable[[A], Option[B]]) -> Option[B]:
+        """Alias for `flat_map`."""
+        return self.flat_map(f)
+
+    @abstractmethod
+    def or_else(self, f: Callable[[], Option[A]]) -> Option[A]:
+        """
+        `self` if it is `Some`, otherwise the result of `f` (only called then).
+
+        >>> Some(1).or_else(lambda: Some(2))
+        Some(1)
+        >>> Nothing.or_else(lambda: Some(2))
+        Some(2)
+        """
+        ...
+
+    @abstractmethod
+    def filter(self, f: Callable[[A], bool]) -> Option[A]:
+        """
+        >>> Some(1).filter(lambda x: x > 0)
+        Some(1)
+        >>> Some(-1).filter(lambda x: x > 0)
+        Nothing
+        """
+        ...
+
+    # --- Folds ---
+
+    @abstractmethod
+    def fold_left(self, initial: ValueT, f: Callable[[ValueT, A], ValueT]) -> ValueT:
+        """
+        >>> Some(1).fold_left(10, lambda acc, x: acc - x)
+        9
+        >>> Nothing.fold_left(10, lambda acc, x: acc - x)
+        10
+        """
+        ...
+
+    @abstractmethod
+    def fold_right(self, initial: ValueT, f: Callable[[A, ValueT], ValueT]) -> ValueT:
+        """
+        >>> Some(1).fold_right(10, lambda x, acc: x - acc)
+        -9
+        """
+        ...
+
+    @abstractmethod
+    def fold_map(
+        self,
+        initial: ValueT,
+        f: Callable[[A], ValueT],
+        combine: Callable[[ValueT, ValueT], ValueT] = add,
+    ) -> ValueT:
+        """
+        >>> Some("abc").fold_map(1, len)
+        4
+        """
+        ...
+
+    @abstractmethod
+    def reduce(self, f: Callable[[ValueT, A], ValueT]) -> Option[A | ValueT]:
+        """
+        `self`, as there is never a second value to combine with.
+
+        >>> Some(1).reduce(max), Nothing.reduce(max)
+        (Some(1), Nothing)
+        """
+        ...
+
+    # --- Async ---
+
+    @abstractmethod
+    async def map_async(self, f: Callable[[A], Awaitable[ValueT]]) -> Option[ValueT]:
+        """
+        >>> import asyncio
+        >>> async def double(x):
+        ...     return x * 2
+        >>> asyncio.run(Some(1).map_async(double))
+        Some(2)
+        """
+        ...
+
+    @abstractmethod
+    async def traverse_async(
+        self, f: Callable[[A], Awaitable[Result[ValueT, E]]]
+    ) -> Result[Option[ValueT], E]:
+        """
+        `f`'s `Result` with the value wrapped in `Some`, or `Success(Nothing)` (without
+        calling `f`) for `Nothing`.
+
+        >>> import asyncio
+        >>> async def check(x):
+        ...     return Success(x) if x > 0 else Failure("not positive")
+        >>> asyncio.run(Some(1).traverse_async(check))
+        Success(Some(1))
+        >>> asyncio.run(Some(-1).traverse_async(check))
+        Failure(not positive)
+        >>> asyncio.run(Nothing.traverse_async(check))
+        Success(Nothing)
+        """
+        ...
 
     # --- Unwrapping ---
 
+    @abstractmethod
+    def unwrap_or(self, default: ValueT) -> A | ValueT:
+        """
+        >>> Some(1).unwrap_or(0), Nothing.unwrap_or(0)
+        (1, 0)
+        """
+        ...
+
+    @abstractmethod
     def unwrap_or_throw_unsafe(self, e: Exception) -> A:
-        if isinstance(self, Some):
-            return self.value
-        else:
-            raise e
+        ...
 
+    @abstractmethod
     def unwrap_unsafe(self) -> A:
-        return self.unwrap_or_throw_unsafe(unexpectedNothing("unwrap_unsafe"))
+        """
+        >>> Nothing.unwrap_unsafe()  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+        ...
+        catepyller.data.option.UnexpectedNothingException: ...
+        """
+        ...
 
 
-@dataclass(frozen=True, repr=False)
-class Some(Option[A], Wrapper):
+class Some(Option[A], Wrapper, Frozen):
+    """
+    >>> Some(1)
+    Some(1)
+    >>> Some(1) == Some(1)
+    True
+    """
+
+    __slots__ = ("value", "_hash")
+    __match_args__ = ("value",)
+
     value: A
+    _hash: int  # Unset until the first call to `__hash__`
+
+    def __init__(self, value: A) -> None:
+        object.__setattr__(self, "value", value)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return (self.value,) == (other.value,)  # type: ignore[attr-defined]
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            object.__setattr__(self, "_hash", hash((self.value,)))
+            return self._hash
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (Some, (self.value,))
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __len__(self) -> int:
+        return 1
+
+    def flat_map(self, f: Callable[[A], Option[B]]) -> Option[B]:
+        return f(self.value)
+
+    and_then = flat_map
+
+    def map(self, f: Callable[[A], B]) -> Option[B]:
+        return Some(f(self.value))
+
+    def apply(self, f: Option[Callable[[A], B]]) -> Option[B]:
+        if type(f) is Some:
+            return Some(f.value(self.value))
+        else:
+            return Nothing
+
+    def product(self, fb: Option[ValueT]) -> Option[tuple[A, ValueT]]:
+        if type(fb) is Some:
+            return Some((self.value, fb.value))
+        else:
+            return Nothing
+
+    def or_else(self, f: Callable[[], Option[A]]) -> Option[A]:
+        return self
+
+    def filter(self, f: Callable[[A], bool]) -> Option[A]:
+        return self if f(self.value) else Nothing
+
+    def fold_left(self, initial: ValueT, f: Callable[[ValueT, A], ValueT]) -> ValueT:
+        return f(initial, self.value)
+
+    def fold_right(self, initial: ValueT, f: Callable[[A, ValueT], ValueT]) -> ValueT:
+        return f(self.value, initial)
+
+    def fold_map(
+        self,
+        initial: ValueT,
+        f: Callable[[A], ValueT],
+        combine: Callable[[ValueT, ValueT], ValueT] = add,
+    ) -> ValueT:
+        return combine(initial, f(self.value))
+
+    def reduce(self, f: Callable[[ValueT, A], ValueT]) -> Option[A | ValueT]:
+        return self
+
+    async def map_async(self, f: Callable[[A], Awaitable[ValueT]]) -> Option[ValueT]:
+        return Some(await f(self.value))
+
+    async def traverse_async(
+        self, f: Callable[[A], Awaitable[Result[ValueT, E]]]
+    ) -> Result[Option[ValueT], E]:
+        return (await f(self.value)).map(Some)  # type: ignore[return-value]
+
+    def unwrap_or(self, default: ValueT) -> A | ValueT:
+        return self.value
+
+    def unwrap_or_throw_unsafe(self, e: Exception) -> A:
+        return self.value
+
+    def unwrap_unsafe(self) -> A:
+        return self.value
 
 
-@dataclass(frozen=True, init=False, repr=False)
 class NothingType(Option[A], Singleton):
     """
     Represents the absence of a value.
     """
 
+    __slots__ = ()
+
+    def __reduce__(self) -> str:
+        """Pickled by reference, so unpickling gives back the same `Nothing`."""
+        return "Nothing"
+
     def __repr__(self) -> str:
         return "Nothing"
 
+    def __bool__(self) -> bool:
+        return False
+
+    def __len__(self) -> int:
+        return 0
+
+    # Any operation on `Nothing` is `Nothing`, as its type parameter is only nominal
+
+    def flat_map(self, f: Callable[[A], Option[B]]) -> Option[B]:
+        return self  # type: ignore[return-value]
+
+    and_then = flat_map
+
+    def map(self, f: Callable[[A], B]) -> Option[B]:
+        return self  # type: ignore[return-value]
+
+    def apply(self, f: Option[Callable[[A], B]]) -> Option[B]:
+        return self  # type: ignore[return-value]
+
+    def product(self, fb: Option[ValueT]) -> Option[tuple[A, ValueT]]:
+        return self  # type: ignore[return-value]
+
+    def or_else(self, f: Callable[[], Option[A]]) -> Option[A]:
+        return f()
+
+    def filter(self, f: Callable[[A], bool]) -> Option[A]:
+        return self
+
+    def fold_left(self, initial: ValueT, f: Callable[[ValueT, A], ValueT]) -> ValueT:
+        return initial
+
+    def fold_right(self, initial: ValueT, f: Callable[[A, ValueT], ValueT]) -> ValueT:
+        return initial
+
+    def fold_map(
+        self,
+        initial: ValueT,
+        f: Callable[[A], ValueT],
+        combine: Callable[[ValueT, ValueT], ValueT] = add,
+    ) -> ValueT:
+        return initial
+
+    def reduce(self, f: Callable[[ValueT, A], ValueT]) -> Option[A | ValueT]:
+        return self
+
+    async def map_async(self, f: Callable[[A], Awaitable[ValueT]]) -> Option[ValueT]:
+        return self  # type: ignore[return-value]
+
+    async def traverse_async(
+        self, f: Callable[[A], Awaitable[Result[ValueT, E]]]
+    ) -> Result[Option[ValueT], E]:
+        return Success(self)  # type: ignore[arg-type]
+
+    def unwrap_or(self, default: ValueT) -> A | ValueT:
+        return default
+
+    def unwrap_or_throw_unsafe(self, e: Exception) -> A:
+        raise e
+
+    def unwrap_unsafe(self) -> A:
+        raise unexpectedNothing("unwrap_unsafe")
+
 
 Nothing: NothingType = NothingType()
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
-from abc import ABC
-from dataclasses import dataclass
-from typing import Any, Callable, Generic, TypeVar, Union
-
-from typing_extensions import TypeGuard
+from abc import ABC, abstractmethod
+from operator import add
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    TypeGuard,
+    TypeVar,
+    Union,
+)
 
 from catepyller.protocols.context_2 import Monad2
-from catepyller.util import Wrapper
+from catepyller.protocols.foldable import Foldable
+from catepyller.util import Frozen, Wrapper
+
+if TYPE_CHECKING:
+    from catepyller.data.option import Option
 
 A = TypeVar("A", covariant=True)
 B = TypeVar("B", covariant=True)
@@ -17,26 +28,353 @@ C = TypeVar("C", contravariant=True)
 T = TypeVar("T")
 
 
-class Result(Monad2[A, B], Generic[A, B], ABC):
+class Result(Monad2[A, B], Foldable[A], Generic[A, B], ABC):
+    """
+    Either a `Success` holding a value or a `Failure` holding an error.
+
+    Every operation is a method implemented separately by `Success` and `Failure`, so
+    there are no type checks on the way: on the side it applies to, it costs one method
+    call plus whatever it has to build, and on the other side it returns `self` without
+    calling the function passed in.
+
+    Targets, per operation: `Success(x).map(f)` within about 5x of calling `f(x)` (most
+    of it being the new `Success`), and operations passing a `Failure` along within
+    about 2x of an empty function call (see
+    `python -m benchmarks.suite run --only result`).
+
+    >>> Success(2).filter(lambda x: x > 1, "too small").map(lambda x: x * 10)
+    Success(20)
+    >>> Failure("oops").map(lambda x: x * 10).map_error(str.upper).unwrap_or(0)
+    0
+    """
+
+    __slots__ = ()
+
     @staticmethod
     def pure(a: T) -> Result[T, Any]:
         return Success(a)
 
+    # --- Combinators ---
+
+    @abstractmethod
+    def and_then(self, f: Callable[[A], Result[C, B]]) -> Result[C, B]:
+        """Alias for `flat_map`."""
+        ...
+
+    @abstractmethod
+    def map_error(self, f: Callable[[B], T]) -> Result[A, T]:
+        """The error mapped with `f`, for a `Failure`."""
+        ...
+
+    @abstractmethod
+    def or_else(self, f: Callable[[B], Result[A, T]]) -> Result[A, T]:
+        """`self` if it is a `Success`, otherwise the result of `f` on the error."""
+        ...
+
+    @abstractmethod
+    def filter(self, f: Callable[[A], bool], error: T) -> Result[A, B | T]:
+        ...
+
+    @abstractmethod
+    def unwrap_or(self, default: T) -> A | T:
+        ...
+
+    # --- Async ---
+
+    @abstractmethod
+    async def map_async(self, f: Callable[[A], Awaitable[C]]) -> Result[C, B]:
+        ...
+
+    @abstractmethod
+    async def traverse_async(
+        self, f: Callable[[A], Awaitable[Result[C, B]]]
+    ) -> Result[C, B]:
+        ...
+
+
+class Success(Result[A, B], Wrapper, Frozen):
+    """
+    >>> Success(1)
+    Success(1)
+    >>> Success(1) == Success(1)
+    True
+    """
+
+    __slots__ = ("value", "_hash")
+    __match_args__ = ("value",)
 
-@dataclass(frozen=True)
-class Success(Result[A, B], Wrapper):
     value: A
+    _hash: int  # Unset until the first call to `__hash__`
+
+    def __init__(self, value: A) -> None:
+        object.__setattr__(self, "value", value)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return (self.value,) == (other.value,)  # type: ignore[attr-defined]
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            object.__setattr__(self, "_hash", hash((self.value,)))
+            return self._hash
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (Success, (self.value,))
 
     def flat_map(self, f: Callable[[A], Result[C, B]]) -> Result[C, B]:
         return f(self.value)
 
+    def map(self, f: Callable[[A], C]) -> Result[C, B]:
+        """
+        >>> Success(1).map(lambda x: x + 1)
+        Success(2)
+        """
+        return Success(f(self.value))
+
+    def apply(self, f: Result[Callable[[A], C], B]) -> Result[C, B]:
+        """
+        >>> Success(1).apply(Success(lambda x: x + 1))
+        Success(2)
+        >>> Success(1).apply(Failure("no function"))
+        Failure(no function)
+        """
+        if type(f) is Success:
+            return Success(f.value(self.value))
+        else:
+            return f  # type: ignore[return-value]
+
+    def product(self, fb: Result[T, B]) -> Result[tuple[A, T], B]:
+        """
+        >>> Success(1).product(Success("a"))
+        Success((1, 'a'))
+        """
+        if type(fb) is Success:
+            return Success((self.value, fb.value))
+        else:
+            return fb  # type: ignore[return-value]
+
+    and_then = flat_map
+
+    def map_error(self, f: Callable[[B], T]) -> Result[A, T]:
+        """
+        >>> success = Success(1)
+        >>> success.map_error(str.upper) is success
+        True
+        """
+        return self  # type: ignore[return-value]
+
+    def or_else(self, f: Callable[[B], Result[A, T]]) -> Result[A, T]:
+        """
+        >>> Success(1).or_else(lambda e: Success(0))
+        Success(1)
+        """
+        return self  # type: ignore[return-value]
+
+    def filter(self, f: Callable[[A], bool], error: T) -> Result[A, B | T]:
+        """
+        `Failure(error)` if the value doesn't satisfy `f`.
+
+        >>> Success(-1).filter(lambda x: x > 0, "not positive")
+        Failure(not positive)
+        """
+        return self if f(self.value) else Failure(error)
+
+    def unwrap_or(self, default: T) -> A | T:
+        """
+        >>> Success(1).unwrap_or(0)
+        1
+        """
+        return self.value
+
+    # --- Folds ---
+
+    def fold_left(self, initial: T, f: Callable[[T, A], T]) -> T:
+        """
+        >>> Success(1).fold_left(10, lambda acc, x: acc - x)
+        9
+        """
+        return f(initial, self.value)
+
+    def fold_right(self, initial: T, f: Callable[[A, T], T]) -> T:
+        return f(self.value, initial)
+
+    def fold_map(
+        self, initial: T, f: Callable[[A], T], combine: Callable[[T, T], T] = add
+    ) -> T:
+        return combine(initial, f(self.value))
+
+    def reduce(self, f: Callable[[T, A], T]) -> Option[A | T]:
+        """
+        >>> Success(1).reduce(max)
+        Some(1)
+        """
+        from catepyller.data.option import Some
+
+        return Some(self.value)
+
+    async def map_async(self, f: Callable[[A], Awaitable[C]]) -> Result[C, B]:
+        """
+        >>> import asyncio
+        >>> async def double(x):
+        ...     return x * 2
+        >>> asyncio.run(Success(1).map_async(double))
+        Success(2)
+        """
+        return Success(await f(self.value))
+
+    async def traverse_async(
+        self, f: Callable[[A], Awaitable[Result[C, B]]]
+    ) -> Result[C, B]:
+        """
+        `f`'s `Result`. Since it shares the failure type with `self`, the nested
+        `Result[Result[C, B], B]` of a plain traverse is collapsed into one.
+
+        >>> import asyncio
+        >>> async def check(x):
+        ...     return Success(x) if x > 0 else Failure("not positive")
+        >>> asyncio.run(Success(-1).traverse_async(check))
+        Failure(not positive)
+        """
+        return await f(self.value)
+
+
+class Failure(Result[A, B], Wrapper, Frozen):
+    """
+    >>> Failure("oops")
+    Failure(oops)
+    >>> Failure("oops") == Success("oops")
+    False
+    """
+
+    __slots__ = ("value", "_hash")
+    __match_args__ = ("value",)
 
-@dataclass(frozen=True)
-class Failure(Result[A, B], Wrapper):
     value: B
+    _hash: int  # Unset until the first call to `__hash__`
+
+    def __init__(self, value: B) -> None:
+        object.__setattr__(self, "value", value)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return (self.value,) == (other.value,)  # type: ignore[attr-defined]
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            object.__setattr__(self, "_hash", hash((self.value,)))
+            return self._hash
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (Failure, (self.value,))
+
+    # A `Failure` is returned as is, since its type parameter `A` is only nominal
 
     def flat_map(self, f: Callable[[A], Result[C, B]]) -> Result[C, B]:
-        return Failure(self.value)
+        return self  # type: ignore[return-value]
+
+    def map(self, f: Callable[[A], C]) -> Result[C, B]:
+        """
+        >>> failure = Failure("oops")
+        >>> failure.map(lambda x: x + 1) is failure
+        True
+        """
+        return self  # type: ignore[return-value]
+
+    def apply(self, f: Result[Callable[[A], C], B]) -> Result[C, B]:
+        """
+        The failure from `f` wins, matching `f.flat_map(self.map)`.
+
+        >>> Failure("no value").apply(Failure("no function"))
+        Failure(no function)
+        """
+        if type(f) is Failure:
+            return f  # type: ignore[return-value]
+        else:
+            return self  # type: ignore[return-value]
+
+    def product(self, fb: Result[T, B]) -> Result[tuple[A, T], B]:
+        """
+        >>> Failure("oops").product(Success(1))
+        Failure(oops)
+        """
+        return self  # type: ignore[return-value]
+
+    and_then = flat_map
+
+    def map_error(self, f: Callable[[B], T]) -> Result[A, T]:
+        """
+        >>> Failure("oops").map_error(str.upper)
+        Failure(OOPS)
+        """
+        return Failure(f(self.value))
+
+    def or_else(self, f: Callable[[B], Result[A, T]]) -> Result[A, T]:
+        """
+        Recovers from the failure, `f` getting the error.
+
+        >>> Failure("oops").or_else(lambda e: Success(len(e)))
+        Success(4)
+        """
+        return f(self.value)
+
+    def filter(self, f: Callable[[A], bool], error: T) -> Result[A, B | T]:
+        return self
+
+    def unwrap_or(self, default: T) -> A | T:
+        """
+        >>> Failure("oops").unwrap_or(0)
+        0
+        """
+        return default
+
+    # --- Folds ---
+
+    # A `Failure` has no value of type `A`, so folds over it are empty
+
+    def fold_left(self, initial: T, f: Callable[[T, A], T]) -> T:
+        """
+        >>> Failure("oops").fold_left(10, lambda acc, x: acc - x)
+        10
+        """
+        return initial
+
+    def fold_right(self, initial: T, f: Callable[[A, T], T]) -> T:
+        return initial
+
+    def fold_map(
+        self, initial: T, f: Callable[[A], T], combine: Callable[[T, T], T] = add
+    ) -> T:
+        return initial
+
+    def reduce(self, f: Callable[[T, A], T]) -> Option[A | T]:
+        """
+        >>> Failure("oops").reduce(max)
+        Nothing
+        """
+        from catepyller.data.option import Nothing
+
+        return Nothing
+
+    async def map_async(self, f: Callable[[A], Awaitable[C]]) -> Result[C, B]:
+        return self  # type: ignore[return-value]
+
+    async def traverse_async(
+        self, f: Callable[[A], Awaitable[Result[C, B]]]
+    ) -> Result[C, B]:
+        """
+        >>> import asyncio
+        >>> async def check(x):
+        ...     raise AssertionError("not called")
+        >>> asyncio.run(Failure("oops").traverse_async(check))
+        Failure(oops)
+        """
+        return self  # type: ignore[return-value]
 
 
 def is_success(r: Result[A, B]) -> TypeGuard[Success[A, B]]:
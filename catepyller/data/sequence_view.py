@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, TypeVar
+
+from catepyller.data.option import Nothing, Option, Some
+from catepyller.protocols.sequence import Sequence
+from catepyller.util import Frozen, equal_elements
+
+A = TypeVar("A")
+
+T = TypeVar("T")
+
+
+class SequenceView(Sequence[A], Frozen):
+    """
+    Slice of a `Sequence` which doesn't copy anything: it is the base sequence plus the
+    `range` of indexes it covers, so any slice (including negative steps) is O(1) to
+    make, and slicing a view again slices the `range`, still pointing at the original
+    sequence. `Sequence.get_slice` (and so `sequence[start:stop:step]`) returns one.
+
+    Reading an element costs one `range` lookup on top of the base's `get_unsafe`.
+    `force` copies the elements into the same kind of sequence as the base.
+
+    >>> from catepyller.data.vector import Vector
+    >>> numbers = Vector.from_iter(range(10))
+    >>> numbers[8:2:-2]
+    SequenceView(8, 6, 4)
+    >>> numbers[::-1][1::3], numbers[::-1][1::3][-1]
+    (SequenceView(8, 5, 2), 2)
+    >>> numbers[::-1][1::3].force()
+    Vector(8, 5, 2)
+    """
+
+    __slots__ = ("_base", "_indices")
+
+    _base: Sequence[A]
+    _indices: range  # Indexes into `_base`
+
+    def __init__(self, base: Sequence[A], indices: range) -> None:
+        """Prefer slicing the base sequence."""
+        object.__setattr__(self, "_base", base)
+        object.__setattr__(self, "_indices", indices)
+
+    # === STATIC ===
+
+    @classmethod
+    def from_iter(cls, iterable: Iterable[T]) -> SequenceView[T]:
+        """
+        A view of all of the values, stored in a `Vector`.
+
+        >>> SequenceView.from_iter("abc")[1:]
+        SequenceView('b', 'c')
+        """
+        from catepyller.data.vector import Vector
+
+        values = Vector.from_iter(iterable)
+        return SequenceView(values, range(values.length))
+
+    # === INSTANCE ===
+
+    @property
+    def length(self) -> int:
+        return len(self._indices)
+
+    def get(self, index: int) -> Option[A]:
+        """
+        >>> from catepyller.data.vector import Vector
+        >>> view = Vector.of(1, 2, 3)[::-1]
+        >>> view.get(0), view.get(-1), view.get(3)
+        (Some(3), Some(1), Nothing)
+        """
+        if not -len(self._indices) <= index < len(self._indices):
+            return Nothing
+        return Some(self._base.get_unsafe(self._indices[index]))
+
+    def get_unsafe(self, index: int) -> A:
+        """
+        Leaves the bounds check to the `range`, so nothing is allocated on the happy
+        path.
+
+        >>> from catepyller.data.vector import Vector
+        >>> Vector.of(1, 2, 3)[1:].get_unsafe(2)
+        Traceback (most recent call last):
+        ...
+        IndexError: range object index out of range
+        """
+        return self._base.get_unsafe(self._indices[index])
+
+    def get_slice(self, slice: slice) -> Option[SequenceView[A]]:
+        return Some(SequenceView(self._base, self._indices[slice]))
+
+    def force(self) -> Sequence[A]:
+        """Copies the elements into a new sequence of the same kind as the base."""
+        return self._base.from_iter(self)
+
+    # --- Python protocols ---
+
+    def __iter__(self) -> Iterator[A]:
+        """
+        >>> from catepyller.data.vector import Vector
+        >>> list(Vector.from_iter(range(10**5))[::-2])[:3]
+        [99999, 99997, 99995]
+        """
+        return map(self._base.get_unsafe, self._indices)
+
+    def __reversed__(self) -> Iterator[A]:
+        return map(self._base.get_unsafe, reversed(self._indices))
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return equal_elements(self, other)  # type: ignore[arg-type]
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickled as the elements, rather than the whole base."""
+        return (SequenceView.from_iter, (tuple(self),))
+
+    def __repr__(self) -> str:
+        return f"SequenceView({', '.join(map(repr, self))})"
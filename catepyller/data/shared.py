@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import os
+import struct
+import sys
+from array import array
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Iterable, Iterator, Optional, TypeVar
+
+from catepyller.data.option import Nothing, Option, Some
+from catepyller.protocols.sequence import Sequence
+from catepyller.util import Frozen
+
+A = TypeVar("A")
+
+# The block starts with the `struct` format of the items and how many there are, so a
+# process attaching by name knows how to read it
+_HEADER = struct.Struct("8sQ")
+
+# Id of this process if attaching a block started its own resource tracker
+_tracker_started_by: Optional[int] = None
+
+
+class SharedSequence(Sequence[A], Frozen):
+    """
+    Immutable `Sequence` of numbers (or bytes) stored in a
+    `multiprocessing.shared_memory` block, for handing large data to worker processes
+    without copying it.
+
+    Pickling a `SharedSequence` (e.g. passing it to a `ProcessPoolExecutor` task) only
+    sends the block's name, and the receiving process attaches to the same memory.
+    `SharedSequence.attach(name)` does the same explicitly. Items are read straight out
+    of the shared block through a read-only `memoryview`, and slices are views into it
+    too.
+
+    The process creating the block owns it: using the sequence as a context manager (or
+    calling `unlink`) frees the block once no process needs it anymore. Other processes
+    only `close` their own mapping.
+
+    >>> with SharedSequence.from_iter([1.5, 2.5, 3.5]) as numbers:
+    ...     attached = SharedSequence.attach(numbers.name)
+    ...     print(attached[::-1], sum(attached))
+    ...     attached.close()
+    SharedSequence([3.5, 2.5, 1.5]) 7.5
+    """
+
+    # Slots are cleared in name order, so `_items` is released before `_memory` closes
+    __slots__ = ("_items", "_memory", "_indices", "_owner")
+
+    _items: memoryview
+    _memory: SharedMemory
+    _indices: range  # Positions in the whole block, for slices
+    _owner: bool
+
+    def __init__(
+        self, memory: SharedMemory, view: memoryview, indices: range, owner: bool
+    ) -> None:
+        """Prefer `SharedSequence.from_iter`, `from_buffer` or `attach`."""
+        object.__setattr__(self, "_items", view)
+        object.__setattr__(self, "_memory", memory)
+        object.__setattr__(self, "_indices", indices)
+        object.__setattr__(self, "_owner", owner)
+
+    # === STATIC ===
+
+    @classmethod
+    def from_iter(
+        cls, iterable: Iterable[A], format: Optional[str] = None
+    ) -> SharedSequence[A]:
+        """
+        Copies the items into a new shared block. `format` is an `array` type code
+        (`"d"` for floats, `"q"` for 64-bit ints, `"B"` for bytes, ...); by default ints
+        are stored as `"q"` and anything else as `"d"`.
+
+        >>> with SharedSequence.from_iter(range(3)) as numbers:
+        ...     numbers.format, tuple(numbers)
+        ('q', (0, 1, 2))
+        """
+        if format is not None:
+            return SharedSequence.from_buffer(array(format, iterable))
+        values = list(iterable)
+        try:
+            return SharedSequence.from_buffer(array("q", values))
+        except TypeError:
+            return SharedSequence.from_buffer(array("d", values))
+
+    @staticmethod
+    def from_buffer(buffer: Any) -> SharedSequence[Any]:
+        """
+        Copies any one-dimensional buffer (`bytes`, `array`, a NumPy array, ...) into a
+        new shared block, keeping its format.
+
+        >>> with SharedSequence.from_buffer(b"abc") as data:
+        ...     tuple(data)
+        (97, 98, 99)
+        """
+        source = memoryview(buffer)
+        if source.ndim != 1:
+            raise ValueError(f"Expected a one-dimensional buffer, got {source.ndim}")
+        format = source.format.lstrip("@")
+        if len(format) != 1:
+            raise ValueError(f"Unsupported buffer format {source.format!r}")
+
+        memory = SharedMemory(create=True, size=_HEADER.size + source.nbytes)
+        buf = memory.buf
+        assert buf is not None  # Only `None` once closed
+        _HEADER.pack_into(buf, 0, format.encode(), len(source))
+        buf[_HEADER.size : _HEADER.size + source.nbytes] = source.cast("B")
+        return _open(memory, range(len(source)), owner=True)
+
+    @staticmethod
+    def attach(name: str) -> SharedSequence[Any]:
+        """
+        Attaches to a block created by `from_iter`/`from_buffer` in any process,
+        without copying it.
+        """
+        return _open(_attach_memory(name), None, owner=False)
+
+    # === INSTANCE ===
+
+    @property
+    def name(self) -> str:
+        """Name of the shared block, to `attach` to from other processes."""
+        return self._memory.name
+
+    @property
+    def format(self) -> str:
+        return self._items.format
+
+    @property
+    def length(self) -> int:
+        return len(self._items)
+
+    def get(self, index: int) -> Option[A]:
+        """
+        >>> with SharedSequence.from_iter([1, 2]) as numbers:
+        ...     numbers.get(-1), numbers.get(2)
+        (Some(2), Nothing)
+        """
+        if not -len(self._items) <= index < len(self._items):
+            return Nothing
+        return Some(self._items[index])  # type: ignore[arg-type]
+
+    def get_unsafe(self, index: int) -> A:
+        return self._items[index]  # type: ignore[return-value]
+
+    def get_slice(self, slice: slice) -> Option[SharedSequence[A]]:
+        """
+        Slices share the block rather than copying it.
+
+        >>> with SharedSequence.from_iter(range(10)) as numbers:
+        ...     print(numbers[8:2:-2][1:])
+        SharedSequence([6, 4])
+        """
+        return Some(
+            SharedSequence(
+                self._memory, self._items[slice], self._indices[slice], owner=False
+            )
+        )
+
+    def to_memoryview(self) -> memoryview:
+        """The (read-only) items, without copying them."""
+        return self._items
+
+    # --- Lifetime ---
+
+    def close(self) -> None:
+        """
+        Unmaps the block from this process. The sequence (and any slice of it) can't be
+        read afterwards; if some slices are still alive, the mapping is only removed
+        once they have been garbage-collected.
+        """
+        self._items.release()
+        try:
+            self._memory.close()
+        except BufferError:
+            pass  # Exported to a live slice, `mmap` closes itself when that goes away
+
+    def unlink(self) -> None:
+        """
+        Frees the block once every process has closed it. Only the process that
+        created it should call this.
+        """
+        self._memory.unlink()
+
+    def __enter__(self) -> SharedSequence[A]:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._owner:
+            self.unlink()
+        self.close()
+
+    # --- Python protocols ---
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[A]:
+        return iter(self._items)  # type: ignore[arg-type]
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._items == other._items  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return hash(tuple(self._items.tolist()))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickled by name, so unpickling attaches to the same block."""
+        return (_attach, (self.name, self._indices))
+
+    def __repr__(self) -> str:
+        return f"SharedSequence({self._items.tolist()})"
+
+
+# --- Helpers ---
+
+
+def _open(
+    memory: SharedMemory, indices: Optional[range], owner: bool
+) -> SharedSequence[Any]:
+    """Reads the header of `memory`, viewing the items at `indices` (default all)."""
+    buf = memory.buf
+    assert buf is not None  # Only `None` once closed
+    format, length = _HEADER.unpack_from(buf, 0)
+    format = format.rstrip(b"\0").decode()
+    items = buf[_HEADER.size : _HEADER.size + length * struct.calcsize(format)]
+    view = items.cast(format).toreadonly()
+    if indices is None:
+        indices = range(length)
+    elif indices != range(length):
+        view = view[_as_slice(indices)]
+    return SharedSequence(memory, view, indices, owner)
+
+
+def _attach(name: str, indices: range) -> SharedSequence[Any]:
+    return _open(_attach_memory(name), indices, owner=False)
+
+
+def _attach_memory(name: str) -> SharedMemory:
+    global _tracker_started_by
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+
+    # Before Python 3.13 attaching also registers the block with a resource tracker.
+    # If this process shares the creator's tracker (it is the creator, or was forked
+    # after the tracker started) that is harmless, but a tracker started by attaching
+    # here would unlink the block under the owner's feet when this process exits
+    if resource_tracker._resource_tracker._fd is None:  # type: ignore[attr-defined]
+        _tracker_started_by = os.getpid()
+    memory = SharedMemory(name)
+    if _tracker_started_by == os.getpid():
+        resource_tracker.unregister(memory._name, "shared_memory")  # type: ignore
+    return memory
+
+
+def _as_slice(indices: range) -> slice:
+    # A negative stop would count from the end, so walking backwards down to index 0
+    # needs `None` instead
+    stop = indices.stop if indices.stop >= 0 else None
+    return slice(indices.start, stop, indices.step)
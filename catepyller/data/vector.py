@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator, TypeVar
+
+from catepyller.data.option import Nothing, Option, Some
+from catepyller.protocols.sequence import Sequence
+from catepyller.util import Frozen, equal_elements
+
+A = TypeVar("A")
+
+T = TypeVar("T")
+
+BITS = 5
+WIDTH = 1 << BITS  # 32
+MASK = WIDTH - 1
+
+# A node is a tuple of up to `WIDTH` children; a leaf is a tuple of up to `WIDTH` values
+Node = tuple[Any, ...]
+
+
+class Vector(Sequence[A], Frozen):
+    """
+    Persistent bit-partitioned vector trie (as in Clojure / Scala's `Vector`).
+
+    Elements live in the leaves of a tree of 32-way tuples, plus a `tail` leaf holding
+    the last (up to) 32 elements. Indexing walks at most log32(n) levels, which is at
+    most 7 for any list that fits in memory, and `append` / `update` only copy the
+    nodes on the path they change; everything else is shared with the original.
+
+    >>> v = Vector.from_iter(range(5))
+    >>> v
+    Vector(0, 1, 2, 3, 4)
+    >>> v.append(5)
+    Vector(0, 1, 2, 3, 4, 5)
+    >>> v.update(0, -1)
+    Vector(-1, 1, 2, 3, 4)
+    >>> v
+    Vector(0, 1, 2, 3, 4)
+    >>> v[1:3]
+    SequenceView(1, 2)
+    >>> v[1:3].force()
+    Vector(1, 2)
+    """
+
+    __slots__ = ("_count", "_shift", "_root", "_tail")
+
+    _count: int
+    _shift: int
+    _root: Node
+    _tail: Node
+
+    def __init__(self, count: int, shift: int, root: Node, tail: Node) -> None:
+        """Prefer `Vector.from_iter` / `Vector.empty()`."""
+        object.__setattr__(self, "_count", count)
+        object.__setattr__(self, "_shift", shift)
+        object.__setattr__(self, "_root", root)
+        object.__setattr__(self, "_tail", tail)
+
+    # === STATIC ===
+
+    @staticmethod
+    def of(*values: T) -> Vector[T]:
+        """
+        >>> Vector.of(1, 2, 3)
+        Vector(1, 2, 3)
+        """
+        return Vector.from_iter(values)
+
+    @classmethod
+    def from_iter(cls, iterable: Iterable[T]) -> Vector[T]:
+        """
+        Builds the whole tree bottom-up in one pass, rather than appending one element
+        at a time.
+
+        >>> Vector.from_iter(range(10**6)).get(765_432)
+        Some(765432)
+        """
+        iterator = iter(iterable)
+        leaves = list(iter(lambda: tuple(islice(iterator, WIDTH)), ()))
+        if not leaves:
+            return _EMPTY
+
+        tail = leaves.pop()
+        count = len(leaves) * WIDTH + len(tail)
+
+        shift = BITS
+        nodes: list[Node] = leaves
+        while len(nodes) > WIDTH:
+            nodes = [tuple(nodes[i : i + WIDTH]) for i in range(0, len(nodes), WIDTH)]
+            shift += BITS
+
+        return Vector(count, shift, tuple(nodes), tail)
+
+    @staticmethod
+    def empty() -> Vector[Any]:
+        """
+        >>> Vector.empty()
+        Vector()
+        """
+        return _EMPTY
+
+    # === INSTANCE ===
+
+    @property
+    def length(self) -> int:
+        """
+        >>> Vector.of(1, 2, 3).length
+        3
+        """
+        return self._count
+
+    def get(self, index: int) -> Option[A]:
+        """
+        Negative indexes count from the end.
+
+        >>> Vector.of(1, 2, 3).get(0)
+        Some(1)
+        >>> Vector.of(1, 2, 3).get(-1)
+        Some(3)
+        >>> Vector.of(1, 2, 3).get(3)
+        Nothing
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            return Nothing
+        return Some(self._leaf_for(index)[index & MASK])
+
+    def get_unsafe(self, index: int) -> A:
+        """
+        Same as `get`, but skips the `Option` on the happy path.
+
+        >>> Vector.of(1, 2, 3).get_unsafe(5)
+        Traceback (most recent call last):
+        ...
+        IndexError: Index (5) out of range
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"Index ({index}) out of range")
+        return self._leaf_for(index)[index & MASK]
+
+    def append(self, value: A) -> Vector[A]:
+        """
+        >>> Vector.from_iter(range(32 * 33)).append(-1).get(-1)
+        Some(-1)
+        """
+        count, shift, root, tail = self._count, self._shift, self._root, self._tail
+
+        if len(tail) < WIDTH:
+            return Vector(count + 1, shift, root, (*tail, value))
+
+        # The tail is full: push it into the tree and start a new one
+        if (count >> BITS) > (1 << shift):
+            # The root is full as well, so grow the tree by one level
+            root = (root, _new_path(shift, tail))
+            shift += BITS
+        else:
+            root = _push_tail(count, shift, root, tail)
+
+        return Vector(count + 1, shift, root, (value,))
+
+    def update(self, index: int, value: A) -> Vector[A]:
+        """
+        Returns a copy with the element at `index` replaced, sharing every node that
+        isn't on the path to it.
+
+        >>> v = Vector.from_iter(range(2000))
+        >>> w = v.update(1000, "x")
+        >>> (v.get(1000), w.get(1000), w.get(999))
+        (Some(1000), Some(x), Some(999))
+        >>> w._root[1] is v._root[1]
+        True
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"Index ({index}) out of range")
+
+        if index >= self._tail_offset:
+            tail = list(self._tail)
+            tail[index & MASK] = value
+            return Vector(self._count, self._shift, self._root, tuple(tail))
+
+        # Walk down to the leaf, then rebuild the path back up to the root
+        path = [self._root]
+        for level in range(self._shift, 0, -BITS):
+            path.append(path[-1][(index >> level) & MASK])
+
+        replacement: Any = value
+        for level, node in zip(range(0, self._shift + 1, BITS), reversed(path)):
+            children = list(node)
+            children[(index >> level) & MASK] = replacement
+            replacement = tuple(children)
+
+        return Vector(self._count, self._shift, replacement, self._tail)
+
+    # --- Python protocols ---
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[A]:
+        """
+        Walks one leaf at a time instead of indexing every element.
+
+        >>> sum(Vector.from_iter(range(10**5)))
+        4999950000
+        """
+        leaves = (self._leaf_for(i) for i in range(0, self._tail_offset, WIDTH))
+        return chain(chain.from_iterable(leaves), self._tail)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return equal_elements(self, other)  # type: ignore[arg-type]
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (Vector.from_iter, (tuple(self),))
+
+    def __repr__(self) -> str:
+        return f"Vector({', '.join(map(repr, self))})"
+
+    # --- Internals ---
+
+    @property
+    def _tail_offset(self) -> int:
+        return self._count - len(self._tail)
+
+    def _leaf_for(self, index: int) -> Node:
+        if index >= self._tail_offset:
+            return self._tail
+        node = self._root
+        for level in range(self._shift, 0, -BITS):
+            node = node[(index >> level) & MASK]
+        return node
+
+
+_EMPTY: Vector[Any] = Vector(0, BITS, (), ())
+
+
+def _new_path(level: int, node: Node) -> Node:
+    while level > 0:
+        node = (node,)
+        level -= BITS
+    return node
+
+
+def _push_tail(count: int, shift: int, root: Node, tail: Node) -> Node:
+    """
+    Returns a copy of `root` with the full `tail` leaf added after its last leaf. `count`
+    is the size of the vector before the push, so `count - 1` indexes the last element
+    of `tail`.
+    """
+    index = count - 1
+
+    # Copy the path down towards where the new leaf goes, stopping early if it falls
+    # into a subtree that doesn't exist yet
+    path: list[tuple[Node, int]] = []
+    node = root
+    level = shift
+    while True:
+        subindex = (index >> level) & MASK
+        path.append((node, subindex))
+        if level == BITS:
+            inserted = tail
+            break
+        if subindex >= len(node):
+            inserted = _new_path(level - BITS, tail)
+            break
+        node = node[subindex]
+        level -= BITS
+
+    for node, subindex in reversed(path):
+        inserted = (*node[:subindex], inserted, *node[subindex + 1 :])
+    return inserted
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from functools import partial, reduce
+from itertools import chain, islice
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar
+
+from catepyller.data.list import List
+
+A = TypeVar("A")
+B = TypeVar("B")
+
+Step = Callable[[Iterator[Any]], Iterator[Any]]
+
+
+class View(Generic[A]):
+    """
+    Lazy pipeline over a collection, created with `List.view()` or `Sequence.view()`.
+
+    `map`, `filter`, `flat_map`, `take` and `drop` only record a step. Nothing runs
+    until the view is forced (by iterating it, `fold`, `to_list` or `force`), at which
+    point every step is applied to each element in a single pass, without building any
+    intermediate collection. A view can be forced any number of times.
+
+    >>> calls = []
+    >>> def double(x):
+    ...     calls.append(x)
+    ...     return x * 2
+    >>> pipeline = List.of(1, 2, 3, 4, 5).view().map(double).filter(lambda x: x > 2)
+    >>> calls
+    []
+    >>> pipeline.take(2).to_list()
+    4 :: 6 :: Nil
+    >>> calls
+    [1, 2, 3]
+    """
+
+    __slots__ = ("_source", "_steps", "_from_iter")
+
+    def __init__(
+        self,
+        source: Callable[[], Iterator[Any]],
+        from_iter: Callable[[Iterable[Any]], Any],
+        steps: tuple[Step, ...] = (),
+    ) -> None:
+        """
+        `source` starts a new pass over the underlying collection, and `from_iter`
+        builds a collection of the same kind for `force`.
+        """
+        self._source = source
+        self._from_iter = from_iter
+        self._steps = steps
+
+    def _then(self, step: Step) -> View[Any]:
+        return View(self._source, self._from_iter, (*self._steps, step))
+
+    # --- Steps ---
+
+    def map(self, f: Callable[[A], B]) -> View[B]:
+        return self._then(partial(map, f))
+
+    def filter(self, f: Callable[[A], bool]) -> View[A]:
+        return self._then(partial(filter, f))
+
+    def filter_not(self, f: Callable[[A], bool]) -> View[A]:
+        return self.filter(lambda x: not f(x))
+
+    def flat_map(self, f: Callable[[A], Iterable[B]]) -> View[B]:
+        """
+        `f` may return a `List` or any other iterable.
+
+        >>> List.of(1, 2).view().flat_map(lambda x: List.of(x, -x)).to_list()
+        1 :: -1 :: 2 :: -2 :: Nil
+        """
+        return self._then(lambda values: chain.from_iterable(map(f, values)))
+
+    def take(self, n: int) -> View[A]:
+        """
+        Keeps (at most) the first `n` elements; stops pulling from the source once they
+        have been produced.
+
+        >>> List.of(1, 2, 3).view().take(5).to_list()
+        1 :: 2 :: 3 :: Nil
+        """
+        return self._then(lambda values: islice(values, n))
+
+    def drop(self, n: int) -> View[A]:
+        """
+        >>> List.of(1, 2, 3).view().drop(2).to_list()
+        3 :: Nil
+        """
+        return self._then(lambda values: islice(values, n, None))
+
+    # --- Forcing ---
+
+    def __iter__(self) -> Iterator[A]:
+        return reduce(lambda values, step: step(values), self._steps, self._source())
+
+    def fold(self, initial: B, f: Callable[[B, A], B]) -> B:
+        """
+        >>> List.of(1, 2, 3).view().map(lambda x: x * 2).fold(0, lambda a, b: a + b)
+        12
+        """
+        return reduce(f, self, initial)
+
+    def to_list(self) -> List[A]:
+        return List.from_iter(self)
+
+    def force(self) -> Any:
+        """
+        Collects the result into the same kind of collection the view was made from.
+
+        >>> from catepyller.data.vector import Vector
+        >>> Vector.of(1, 2, 3).view().map(str).force()
+        Vector('1', '2', '3')
+        """
+        return self._from_iter(self)
+
+    def __repr__(self) -> str:
+        return f"View(<{len(self._steps)} steps>)"
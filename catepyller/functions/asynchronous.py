@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable, Optional, TypeVar
+
+from catepyller.data.list import List
+from catepyller.data.result import Failure, Result, Success
+
+A = TypeVar("A")
+B = TypeVar("B")
+E = TypeVar("E")
+
+
+async def map_async(
+    items: Iterable[A], f: Callable[[A], Awaitable[B]], *, limit: Optional[int] = None
+) -> List[B]:
+    """
+    Awaits `f` on every item concurrently, with at most `limit` calls in flight at a
+    time (no limit by default). The results are in the same order as `items`, however
+    the calls finish.
+
+    If a call raises, the calls still running are cancelled and the exception is
+    re-raised.
+
+    >>> async def double(x):
+    ...     await asyncio.sleep(0.01 * (3 - x))  # Later items finish first
+    ...     return x * 2
+    >>> asyncio.run(map_async(range(3), double, limit=2))
+    0 :: 2 :: 4 :: Nil
+    """
+    return List.from_iter(await _run(items, f, limit, short_circuit=False))
+
+
+async def traverse_async(
+    items: Iterable[A],
+    f: Callable[[A], Awaitable[Result[B, E]]],
+    *,
+    limit: Optional[int] = None,
+) -> Result[List[B], E]:
+    """
+    Like `map_async` for a function returning a `Result`: `Success` of all the values
+    (in order) if every call succeeds, otherwise the first `Failure` to come back. As
+    soon as there is a `Failure` the calls still running are cancelled, and no new ones
+    are started.
+
+    >>> async def parse(s):
+    ...     await asyncio.sleep(0)
+    ...     return Success(int(s)) if s.isdigit() else Failure(f"not a number: {s}")
+    >>> asyncio.run(traverse_async(["1", "2"], parse))
+    Success(1 :: 2 :: Nil)
+    >>> asyncio.run(traverse_async(["1", "x", "3"], parse, limit=1))
+    Failure(not a number: x)
+    """
+    results = await _run(items, f, limit, short_circuit=True)
+    if type(results) is Failure:
+        return results
+    return Success(List.from_iter(result.value for result in results))
+
+
+# --- Helpers ---
+
+
+class _ShortCircuit(Exception):
+    """Raised by a worker to stop the others, carrying the `Failure` it got."""
+
+    def __init__(self, failure: Failure[Any, Any]) -> None:
+        self.failure = failure
+
+
+async def _run(
+    items: Iterable[A],
+    f: Callable[[A], Awaitable[Any]],
+    limit: Optional[int],
+    short_circuit: bool,
+) -> Any:
+    """
+    The results of `f` in the order of `items`, or the first `Failure` when
+    `short_circuit` is set.
+
+    Rather than a task per item waiting on a semaphore, `limit` workers share a single
+    iterator of the items, so only as many tasks exist as can actually run at once.
+    """
+    assert limit is None or limit >= 1
+    values = tuple(items)
+    if not values:
+        return ()
+
+    results: list[Any] = [None] * len(values)
+    remaining = iter(enumerate(values))
+
+    async def worker() -> None:
+        for index, value in remaining:
+            result = await f(value)
+            if short_circuit and type(result) is Failure:
+                raise _ShortCircuit(result)
+            results[index] = result
+
+    workers = len(values) if limit is None else min(limit, len(values))
+    tasks = [asyncio.ensure_future(worker()) for _ in range(workers)]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        # Also reached if we are cancelled ourselves, so no task outlives the call
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    for task in done:
+        error = None if task.cancelled() else task.exception()
+        if isinstance(error, _ShortCircuit):
+            return error.failure
+        if error is not None:
+            raise error
+    return results
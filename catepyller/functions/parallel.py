@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import chain, islice, repeat
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+from catepyller.data.list import List
+
+A = TypeVar("A")
+B = TypeVar("B")
+
+# How many chunks to aim for per worker by default, so that uneven chunks even out
+CHUNKS_PER_WORKER = 4
+
+
+def par_map(
+    items: Iterable[A],
+    f: Callable[[A], B],
+    *,
+    chunk_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[B]:
+    """
+    Like `List.map`, but runs `f` on chunks of `items` in parallel.
+
+    Without an `executor` a `ProcessPoolExecutor` with `max_workers` workers is started
+    (and shut down) for the call, so `f` and the items must be picklable, e.g. `f`
+    defined at the top level of a module rather than a `lambda`. Pass a
+    `ThreadPoolExecutor` instead for functions which release the GIL (I/O, NumPy, ...).
+
+    `chunk_size` defaults to splitting `items` into about `CHUNKS_PER_WORKER` chunks per
+    worker. The results are always in the same order as `items`.
+
+    >>> par_map(List.from_iter(range(-3, 3)), abs, chunk_size=2)
+    3 :: 2 :: 1 :: 0 :: 1 :: 2 :: Nil
+    """
+    return _run(_map_chunk, f, items, chunk_size, max_workers, executor)
+
+
+def par_filter(
+    items: Iterable[A],
+    f: Callable[[A], bool],
+    *,
+    chunk_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[A]:
+    """
+    Like `List.filter`, but runs `f` on chunks of `items` in parallel (see `par_map`).
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> with ThreadPoolExecutor(2) as pool:
+    ...     par_filter(range(10), lambda x: x % 3 == 0, chunk_size=3, executor=pool)
+    0 :: 3 :: 6 :: 9 :: Nil
+    """
+    return _run(_filter_chunk, f, items, chunk_size, max_workers, executor)
+
+
+def par_flat_map(
+    items: Iterable[A],
+    f: Callable[[A], Iterable[B]],
+    *,
+    chunk_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[B]:
+    """
+    Like `List.flat_map`, but runs `f` on chunks of `items` in parallel (see
+    `par_map`). `f` may return a `List` or any other iterable.
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> with ThreadPoolExecutor(2) as pool:
+    ...     par_flat_map(List.of(1, 2, 3), lambda x: List.of(x, -x), executor=pool)
+    1 :: -1 :: 2 :: -2 :: 3 :: -3 :: Nil
+    """
+    return _run(_flat_map_chunk, f, items, chunk_size, max_workers, executor)
+
+
+# --- Helpers ---
+
+# These run in the workers, so must be defined at the top level to be picklable
+
+
+def _map_chunk(f: Callable[[A], B], chunk: tuple[A, ...]) -> tuple[B, ...]:
+    return tuple(map(f, chunk))
+
+
+def _filter_chunk(f: Callable[[A], bool], chunk: tuple[A, ...]) -> tuple[A, ...]:
+    return tuple(filter(f, chunk))
+
+
+def _flat_map_chunk(
+    f: Callable[[A], Iterable[B]], chunk: tuple[A, ...]
+) -> tuple[B, ...]:
+    return tuple(chain.from_iterable(map(f, chunk)))
+
+
+def _chunks(items: tuple[A, ...], size: int) -> Iterator[tuple[A, ...]]:
+    iterator = iter(items)
+    return iter(lambda: tuple(islice(iterator, size)), ())
+
+
+def _run(
+    run_chunk: Callable[[Callable, tuple], tuple],
+    f: Callable,
+    items: Iterable,
+    chunk_size: Optional[int],
+    max_workers: Optional[int],
+    executor: Optional[Executor],
+) -> List:
+    results = _run_chunks(run_chunk, f, tuple(items), chunk_size, max_workers, executor)
+    return List.from_iter(chain.from_iterable(results))
+
+
+def _run_chunks(
+    run_chunk: Callable[[Callable, tuple], B],
+    f: Callable,
+    values: tuple,
+    chunk_size: Optional[int],
+    max_workers: Optional[int],
+    executor: Optional[Executor],
+) -> list[B]:
+    """The results of `run_chunk(f, chunk)` for each chunk of `values`, in order."""
+    if not values:
+        return []
+
+    if chunk_size is None:
+        workers = max_workers or os.cpu_count() or 1
+        chunk_size = max(1, -(-len(values) // (workers * CHUNKS_PER_WORKER)))
+    assert chunk_size >= 1
+
+    chunks = _chunks(values, chunk_size)
+    if executor is not None:
+        return list(executor.map(run_chunk, repeat(f), chunks))
+    with ProcessPoolExecutor(max_workers) as pool:
+        return list(pool.map(run_chunk, repeat(f), chunks))
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 from operator import add
-from typing import Any, Callable, TypeVar, overload
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, TypeVar, overload
 
-from catepyller.data.list import List
-from catepyller.data.option import NothingType, Option, Some
+from catepyller.data.catenable_list import (
+    CatenableList,
+    CatenableNilType,
+    CatenableNode,
+)
+from catepyller.data.list import Elem, List, NilType
+from catepyller.data.option import Nothing, NothingType, Option, Some
 from catepyller.protocols.semigroup import SupportsAdd
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 A = TypeVar("A", covariant=True, bound=SupportsAdd)
 
 
@@ -25,6 +33,13 @@ def combine(
     this: List[A], other: List[A], combineF: Callable[[A, A], A]
 ) -> List[A]: ...
 
+@overload
+def combine(this: CatenableList[A], other: CatenableList[A]) -> CatenableList[A]: ...
+@overload
+def combine(
+    this: CatenableList[A], other: CatenableList[A], combineF: Callable[[A, A], A]
+) -> CatenableList[A]: ...
+
 @overload
 def combine(this: list[A], other: list[A]) -> list[A]: ...
 @overload
@@ -51,26 +66,120 @@ def combine(
     other: Any[A],
     combineF: Callable[[A, A], A] = add,
 ) -> Any[A]:
-    if isinstance(this, Option) and isinstance(other, Option):
+    """
+    `List`s are concatenated, copying `this`, so combining many lists one after the
+    other into a `List` is quadratic. To do it in linear time, use a `CatenableList`
+    as the accumulator instead: combining it with a `CatenableList` or a `List` is
+    O(1), since neither side is copied, and `to_list` turns the result back into a
+    `List`.
+
+    >>> combine(Some(1), Some(2))
+    Some(3)
+    >>> combine(List.of(1, 2), List.of(3))
+    1 :: 2 :: 3 :: Nil
+    >>> logs = CatenableList.empty()
+    >>> for batch in range(10_000):
+    ...     logs = combine(logs, List.of(batch, batch))
+    >>> logs.to_list().drop_first(19_998)
+    9999 :: 9999 :: Nil
+    """
+    # Exact type checks, as `isinstance` against the `Protocol`-based classes is slow
+    this_type, other_type = type(this), type(other)
+    if this_type in _OPTION_TYPES and other_type in _OPTION_TYPES:
         return _combineOption(this, other, combineF)
-    elif isinstance(this, List) and isinstance(other, List):
-        # TODO: ...
-        raise NotImplementedError()
+    elif this_type in _CATENABLE_TYPES or other_type in _CATENABLE_TYPES:
+        return _catenable(this).extend(other)
+    elif this_type in _LIST_TYPES and other_type in _LIST_TYPES:
+        return this.extend(other)
     elif isinstance(this, set) and isinstance(other, set):
         return this.union(other)
     else:  # `set` and `list`
         return this + other
 
 
+def combine_all(
+    items: Iterable[A],
+    combineF: Callable[[A, A], A] = add,
+    *,
+    parallel: bool = False,
+    chunk_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Option[A]:
+    """
+    Combines all of `items` with `combineF`, which must be associative, or `Nothing`
+    if there are none.
+
+    The items are combined pairwise in a balanced tree rather than one after the other,
+    so each intermediate value is combined O(log n) times (rather than O(n) for a left
+    fold), which keeps merging growing values (`str`, `tuple`, ...) from going
+    quadratic.
+
+    With `parallel=True` (or an `executor`), chunks of `items` are combined in a
+    process pool the same way as `catepyller.functions.parallel.par_map`, and then
+    their results.
+
+    >>> combine_all(range(1, 101))
+    Some(5050)
+    >>> combine_all(["a", "b", "c"])
+    Some(abc)
+    >>> combine_all([Some(1), Nothing, Some(2)], combine)
+    Some(Some(3))
+    >>> combine_all([])
+    Nothing
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> with ThreadPoolExecutor(2) as pool:
+    ...     combine_all(List.of("a", "b", "c"), chunk_size=2, executor=pool)
+    Some(abc)
+    """
+    if not parallel and executor is None:
+        return _combine_tree(items, combineF)
+
+    from catepyller.functions.parallel import _run_chunks
+
+    # Each chunk is non-empty, so each of them gives a value
+    results = _run_chunks(
+        _combine_chunk, combineF, tuple(items), chunk_size, max_workers, executor
+    )
+    return _combine_tree(results, combineF)
+
+
+def _combine_tree(items: Iterable[A], combineF: Callable[[A, A], A]) -> Option[A]:
+    # Combines neighbouring pairs level by level, each level in one `map` call
+    values = list(items)
+    if not values:
+        return Nothing
+    while len(values) > 1:
+        odd = values[-1:] if len(values) % 2 else []
+        values = list(map(combineF, values[::2], values[1::2]))
+        values += odd
+    return Some(values[0])
+
+
+def _combine_chunk(combineF: Callable[[A, A], A], chunk: tuple[A, ...]) -> A:
+    # Runs in the workers, so must be defined at the top level to be picklable
+    return _combine_tree(chunk, combineF).unwrap_unsafe()
+
+
+_OPTION_TYPES = frozenset((Some, NothingType))
+_LIST_TYPES = frozenset((Elem, NilType))
+_CATENABLE_TYPES = frozenset((CatenableNode, CatenableNilType))
+
+
+def _catenable(lst: CatenableList[A] | List[A]) -> CatenableList[A]:
+    if type(lst) in _CATENABLE_TYPES:
+        return lst  # type: ignore[return-value]
+    return CatenableList.from_list(lst)  # type: ignore[arg-type]
+
+
 def _combineOption(
     this: Option[A],
     other: Option[A],
     combineF: Callable[[A, A], A] = add,
 ) -> Option[A]:
-    if isinstance(this, Some) and isinstance(other, Some):
+    if type(this) is Some and type(other) is Some:
         return Some(combineF(this.value, other.value))
-    else:
-        if isinstance(this, NothingType):
-            return other
-        else:  # `other` is `Nothing``
-            return this
+    elif this is Nothing:
+        return other
+    else:  # `other` is `Nothing`
+        return this
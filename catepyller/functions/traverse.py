@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from collections.abc import Sized
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+from catepyller.data.list import List, _build
+from catepyller.data.option import Nothing, NothingType, Option, Some
+from catepyller.data.result import Failure, Result, Success
+from catepyller.operator import identity
+
+A = TypeVar("A")
+B = TypeVar("B")
+E = TypeVar("E")
+
+
+def traverse_option(items: Iterable[A], f: Callable[[A], Option[B]]) -> Option[List[B]]:
+    """
+    `Some` of the values from applying `f` to each item, or `Nothing` as soon as `f`
+    returns `Nothing`, in which case the remaining items are not looked at.
+
+    >>> def parse(s):
+    ...     print("parsing", s)
+    ...     return Some(int(s)) if s.isdigit() else Nothing
+    >>> traverse_option(["1", "2"], parse)
+    parsing 1
+    parsing 2
+    Some(1 :: 2 :: Nil)
+    >>> traverse_option(["1", "x", "3"], parse)
+    parsing 1
+    parsing x
+    Nothing
+    >>> traverse_option([1], lambda x: x)
+    Traceback (most recent call last):
+    ...
+    TypeError: Expected `f` to return Some or NothingType, got int
+    """
+    stop = _Stop()
+    values = _build(stop.unwrap(map(f, items), Some, NothingType), size=_size(items))
+    return Some(values) if stop.reason is None else Nothing
+
+
+def sequence_option(options: Iterable[Option[A]]) -> Option[List[A]]:
+    """
+    >>> sequence_option(List.of(Some(1), Some(2)))
+    Some(1 :: 2 :: Nil)
+    >>> sequence_option([Some(1), Nothing])
+    Nothing
+    """
+    return traverse_option(options, identity)
+
+
+def traverse_result(
+    items: Iterable[A], f: Callable[[A], Result[B, E]]
+) -> Result[List[B], E]:
+    """
+    `Success` of the values from applying `f` to each item, or the first `Failure`
+    `f` returns, in which case the remaining items are not looked at.
+
+    >>> def parse(s):
+    ...     return Success(int(s)) if s.isdigit() else Failure(f"not a number: {s}")
+    >>> traverse_result(["1", "2"], parse)
+    Success(1 :: 2 :: Nil)
+    >>> traverse_result(iter(["1", "x", "y"]), parse)
+    Failure(not a number: x)
+    >>> traverse_result([1, 2], lambda x: None)
+    Traceback (most recent call last):
+    ...
+    TypeError: Expected `f` to return Success or Failure, got NoneType
+    """
+    stop = _Stop()
+    values = _build(stop.unwrap(map(f, items), Success, Failure), size=_size(items))
+    return Success(values) if stop.reason is None else stop.reason
+
+
+def sequence_result(results: Iterable[Result[A, E]]) -> Result[List[A], E]:
+    """
+    >>> sequence_result(List.of(Success(1), Success(2)))
+    Success(1 :: 2 :: Nil)
+    >>> sequence_result([Success(1), Failure("oops"), Failure("later")])
+    Failure(oops)
+    """
+    return traverse_result(results, identity)
+
+
+# --- Helpers ---
+
+
+class _Stop:
+    """
+    Records the first failure, which ends `unwrap`. Anything which is neither a success
+    nor a failure raises, so `reason` is only `None` if there was no failure.
+    """
+
+    __slots__ = ("reason",)
+
+    def __init__(self) -> None:
+        self.reason: Any = None
+
+    def unwrap(
+        self, wrapped: Iterator[Any], success: type[Any], failure: type[Any]
+    ) -> Iterator[Any]:
+        for value in wrapped:
+            if type(value) is not success:
+                if type(value) is not failure:
+                    raise TypeError(
+                        f"Expected `f` to return {success.__name__} or"
+                        f" {failure.__name__}, got {type(value).__name__}"
+                    )
+                self.reason = value
+                return
+            yield value.value
+
+
+def _size(items: Iterable[Any]) -> int | None:
+    """
+    The number of items if it is known up front, so `_build` can skip fixing up the
+    lengths afterwards (if it stops early, the partial list is thrown away anyway).
+    """
+    return len(items) if isinstance(items, Sized) else None
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from collections import deque
+from itertools import groupby, islice
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+A = TypeVar("A")
+
+# Streaming building blocks for `List` and `LazyList`'s `chunks_of`, `window` and
+# `partition_by`. Each one only pulls as many items as the group it is yielding needs,
+# so the memory used is bounded by the group size however long (or lazy) `items` is.
+
+
+def chunks_of(
+    items: Iterable[A], n: int, drop_remainder: bool = False
+) -> Iterator[tuple[A, ...]]:
+    """
+    Consecutive groups of `n` items. The last one is shorter if the number of items
+    isn't a multiple of `n`, and left out if `drop_remainder`.
+
+    >>> list(chunks_of(range(5), 2))
+    [(0, 1), (2, 3), (4,)]
+    >>> list(chunks_of(range(5), 2, drop_remainder=True))
+    [(0, 1), (2, 3)]
+    """
+    assert n >= 1
+    iterator = iter(items)
+    for chunk in iter(lambda: tuple(islice(iterator, n)), ()):
+        if len(chunk) < n and drop_remainder:
+            return
+        yield chunk
+
+
+def window(
+    items: Iterable[A], size: int, step: int = 1, drop_remainder: bool = False
+) -> Iterator[tuple[A, ...]]:
+    """
+    Windows of `size` items, starting every `step` items (so they overlap when `step`
+    is smaller than `size`, and skip items when it is larger).
+
+    If the items run out before the next full window, and some of them haven't been in
+    a window yet, the window made of what is left is yielded too, unless
+    `drop_remainder`.
+
+    The items are kept in a ring buffer of `size` items, so moving a window along costs
+    O(step) whatever its size (besides copying the window out).
+
+    >>> list(window(range(5), 3))
+    [(0, 1, 2), (1, 2, 3), (2, 3, 4)]
+    >>> list(window(range(6), 3, step=2))
+    [(0, 1, 2), (2, 3, 4), (4, 5)]
+    >>> list(window(range(6), 3, step=2, drop_remainder=True))
+    [(0, 1, 2), (2, 3, 4)]
+    >>> list(window(range(7), 2, step=3))
+    [(0, 1), (3, 4), (6,)]
+    """
+    assert size >= 1 and step >= 1
+    iterator = iter(items)
+    buffer: deque[A] = deque(islice(iterator, size), maxlen=size)
+    if len(buffer) < size:
+        if buffer and not drop_remainder:
+            yield tuple(buffer)
+        return
+    yield tuple(buffer)
+
+    while True:
+        new = tuple(islice(iterator, step))
+        buffer.extend(new)
+        if len(new) == step:
+            yield tuple(buffer)
+            continue
+        # The items ran out: what is left starts where the next window would have
+        remainder = size + len(new) - step
+        if new and remainder > 0 and not drop_remainder:
+            yield tuple(buffer)[-remainder:]
+        return
+
+
+def partition_by(items: Iterable[A], f: Callable[[A], Any]) -> Iterator[tuple[A, ...]]:
+    """
+    Runs of consecutive items for which `f` gives the same value.
+
+    >>> list(partition_by([1, 3, 2, 4, 5], lambda x: x % 2))
+    [(1, 3), (2, 4), (5,)]
+    """
+    for _, run in groupby(items, f):
+        yield tuple(run)
@@ -1 +1,2 @@
 from .context import Monad
+from .foldable import Foldable
@@ -10,18 +10,24 @@ ValueT = TypeVar("ValueT")
 
 @runtime_checkable
 class Functor(Protocol[A]):
+    __slots__ = ()
+
     def map(self, f: Callable[[A], B]) -> Functor[B]:
         ...
 
 
 @runtime_checkable
 class Semigroupal(Protocol[A]):
+    __slots__ = ()
+
     def product(self, fb: Any[B]) -> Semigroupal[tuple[A, B]]:
         ...
 
 
 @runtime_checkable
-class Applicative(Functor[A], Protocol[A]):
+class Applicative(Functor[A], Semigroupal[A], Protocol[A]):
+    __slots__ = ()
+
     @classmethod
     def pure(cls, value: ValueT) -> Any[ValueT]:
         """
@@ -48,13 +54,29 @@ class Monad(Applicative[A], Protocol[A]):
     Must re-declare with correct types:
     - map
     - apply
+    - product
     """
 
+    __slots__ = ()
+
     def flat_map(self, f: Callable[[A], Any[B]]) -> Monad[B]:
         ...
 
+    # Generic defaults, built on `flat_map`. Implementations should override these with
+    # direct versions where they can, since going through `flat_map` allocates an
+    # intermediate context (and for `apply` / `product`, a closure) per element.
+
     def map(self, f: Callable[[A], B]) -> Any[B]:
-        return self.flat_map(self.pure(f))
+        def pure_f(a: Any) -> Any:
+            return self.pure(f(a))
+
+        return self.flat_map(pure_f)
 
     def apply(self, f: Any[Callable[[A], B]]) -> Any[B]:
         return f.flat_map(self.map)
+
+    def product(self, fb: Any[B]) -> Any[tuple[A, B]]:
+        def pair_with(a: Any) -> Any:
+            return fb.map(lambda b: (a, b))
+
+        return self.flat_map(pair_with)
@@ -13,12 +13,16 @@ ValueT = TypeVar("ValueT")
 
 @runtime_checkable
 class Functor2(Protocol[A, B]):
+    __slots__ = ()
+
     def map(self, f: Callable[[A], C]) -> Functor2[C, B]:
         ...
 
 
 @runtime_checkable
 class Semigroupal2(Protocol[A, B]):
+    __slots__ = ()
+
     def product(
         self, fb: Any[C, D]
     ) -> Semigroupal2[tuple[A, C], B | D]:  # Is this right ???
@@ -26,7 +30,9 @@ class Semigroupal2(Protocol[A, B]):
 
 
 @runtime_checkable
-class Applicative2(Functor2[A, B], Protocol[A, B]):
+class Applicative2(Functor2[A, B], Semigroupal2[A, B], Protocol[A, B]):
+    __slots__ = ()
+
     @classmethod
     def pure(cls, value: ValueT) -> Any[ValueT]:
         """
@@ -53,13 +59,27 @@ class Monad2(Applicative2[A, B], Protocol[A, B]):
     Suggested to re-declare with correct types:
     - map
     - apply
+    - product
     """
 
+    __slots__ = ()
+
     def flat_map(self, f: Callable[[A], Any[C, B]]) -> Monad2[C, B]:
         ...
 
+    # Generic defaults, see `Monad`
+
     def map(self, f: Callable[[A], C]) -> Functor2[C, B]:
-        return self.flat_map(self.pure(f))
+        def pure_f(a: Any) -> Any:
+            return self.pure(f(a))
+
+        return self.flat_map(pure_f)
 
     def apply(self, f: Any[Callable[[A, B], C]]) -> Applicative2[C, B]:
         return f.flat_map(self.map)
+
+    def product(self, fb: Any[C, D]) -> Semigroupal2[tuple[A, C], B | D]:
+        def pair_with(a: Any) -> Any:
+            return fb.map(lambda c: (a, c))
+
+        return self.flat_map(pair_with)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from operator import add
+from typing import TYPE_CHECKING, Any, Callable, Protocol, TypeVar, runtime_checkable
+
+if TYPE_CHECKING:
+    from catepyller.data.option import Option
+
+A = TypeVar("A", covariant=True)
+B = TypeVar("B")
+
+M = TypeVar("M")
+
+
+@runtime_checkable
+class Foldable(Protocol[A]):
+    """
+    Must implement `fold_left`.
+
+    Folds over a large structure must not recurse per element, so that they work
+    however many elements there are.
+    """
+
+    __slots__ = ()
+
+    def fold_left(self, initial: B, f: Callable[[B, A], B]) -> B:
+        """
+        Haskell -> 'foldl'
+        Scala -> 'foldLeft'
+        """
+        ...
+
+    # Generic defaults, built on `fold_left`. Implementations should override these with
+    # direct versions where they can, since these allocate a closure per call (and
+    # `fold_right` a list of all the elements).
+
+    def fold_right(self, initial: B, f: Callable[[A, B], B]) -> B:
+        """
+        Haskell -> 'foldr'
+        Scala -> 'foldRight'
+        """
+        values: list[A] = self.fold_left([], _append)  # type: ignore[arg-type]
+        for value in reversed(values):
+            initial = f(value, initial)
+        return initial
+
+    def fold_map(
+        self, initial: M, f: Callable[[A], M], combine: Callable[[M, M], M] = add
+    ) -> M:
+        """
+        Combines the results of `f` on every element, starting from `initial`.
+
+        Haskell -> 'foldMap'
+        Scala -> 'foldMap'
+        """
+
+        def step(acc: M, value: Any) -> M:
+            return combine(acc, f(value))
+
+        return self.fold_left(initial, step)
+
+    def reduce(self, f: Callable[[B, A], B]) -> Option[A | B]:
+        """
+        Folds the elements from the left without an initial value, `Nothing` if there
+        are none.
+
+        Haskell -> 'foldl1'
+        Scala -> 'reduceLeftOption'
+        """
+        from catepyller.data.option import Nothing, Some
+
+        def step(acc: Option[Any], value: Any) -> Option[Any]:
+            return Some(f(acc.value, value)) if type(acc) is Some else Some(value)
+
+        return self.fold_left(Nothing, step)  # type: ignore[arg-type]
+
+
+def _append(values: list[B], value: B) -> list[B]:
+    values.append(value)
+    return values
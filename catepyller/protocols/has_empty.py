@@ -12,6 +12,8 @@ class SupportsDefault(Protocol):
     Weaker version of `Monoid`
     """
 
+    __slots__ = ()
+
     @classmethod
     def default(cls: Type[S]) -> S:
         ...
@@ -24,6 +26,8 @@ class SupportsEmpty(Protocol[A]):
     NOTE: `NonEmptyList` cannot satisfy `SupportsEmpty`
     """
 
+    __slots__ = ()
+
     # NOTE: Assumes we don't need `A` to be a `Monoid`
     @staticmethod
     def empty() -> SupportsEmpty[Any]:
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Protocol, TypeVar
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from catepyller.data.list import List
+
+A = TypeVar("A")
+
+T = TypeVar("T")
+
+
+class SupportsParallel(Iterable[A], Protocol[A]):
+    """
+    `par_map`, `par_filter` and `par_flat_map` for any iterable, as methods which run
+    the functions from `catepyller.functions.parallel` on `self`.
+    """
+
+    __slots__ = ()
+
+    def par_map(
+        self,
+        f: Callable[[A], T],
+        *,
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[T]:
+        """
+        `map` over chunks run in parallel, returning a `List`. See
+        `catepyller.functions.parallel.par_map`.
+        """
+        from catepyller.functions.parallel import par_map
+
+        return par_map(
+            self,
+            f,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            executor=executor,
+        )
+
+    def par_filter(
+        self,
+        f: Callable[[A], bool],
+        *,
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[A]:
+        """
+        `filter` over chunks run in parallel, see
+        `catepyller.functions.parallel.par_filter`.
+        """
+        from catepyller.functions.parallel import par_filter
+
+        return par_filter(
+            self,
+            f,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            executor=executor,
+        )
+
+    def par_flat_map(
+        self,
+        f: Callable[[A], Iterable[T]],
+        *,
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[T]:
+        """
+        `flat_map` over chunks run in parallel, see
+        `catepyller.functions.parallel.par_flat_map`.
+        """
+        from catepyller.functions.parallel import par_flat_map
+
+        return par_flat_map(
+            self,
+            f,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            executor=executor,
+        )
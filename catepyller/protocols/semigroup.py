@@ -27,4 +27,4 @@ class Semigroup(SupportsAdd):
         ...
 
     def __add__(self: S, other: S):
-        self.combine(other)
+        return self.combine(other)
@@ -3,33 +3,38 @@ from __future__ import annotations
 import itertools
 import typing
 from abc import abstractmethod
-from typing import Any, Callable, Iterable, TypeVar, overload
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar, overload
 
-from catepyller.data.option import Option, Some
+from catepyller.data.option import Nothing, Option, Some
+from catepyller.data.view import View
+from catepyller.protocols.parallel import SupportsParallel
 
 A = TypeVar("A")
 B = TypeVar("B", contravariant=True)
 
-# T = TypeVar("T")
+T = TypeVar("T")
 
 
 # TODO: Maybe create ToIterable and FromIterable protocols?
 
 
-class Sequence(typing.Sequence[A], typing.Collection[A], typing.Sized):
+class Sequence(
+    typing.Sequence[A], typing.Collection[A], typing.Sized, SupportsParallel[A]
+):
     """
     Similar to `typing.Sequence` but with more functionality.
 
     Must implement `get` and `__len__`.
 
-    Note: Some of the mixin methods, such as __iter__(), __reversed__() and index(),
-    make repeated calls to the underlying __getitem__() method. Consequently, if
-    __getitem__() is implemented with constant access speed, the mixin methods will
-    have linear performance; however, if the underlying method is linear (as it would
-    be with a linked list), the mixins will have quadratic performance and will likely
-    need to be overridden.
+    Note: The default `__iter__` and `__reversed__` call `get_unsafe` once per index,
+    so they are linear only when `get` takes constant time. Implementations whose `get`
+    is O(n) (as it would be with a linked list) must override `__iter__` (and
+    `__reversed__`), or iterating will be quadratic; `index`, `__contains__` and
+    `count` go through `__iter__`.
     """
 
+    __slots__ = ()
+
     # ====== Abstract ======
 
     @classmethod
@@ -55,29 +60,40 @@ class Sequence(typing.Sequence[A], typing.Collection[A], typing.Sized):
     # ====== Concrete ======
 
     def get_slice(self, slice: slice) -> Option[Sequence[A]]:
-        # TODO: Doesn't work correctly for `[::-1]`
-        return Some(
-            self.from_iter(
-                self.get_unsafe(x)
-                for x in range(
-                    slice.start if slice.start is not None else 0,
-                    slice.stop if slice.stop is not None else self.length,
-                    slice.step if slice.step is not None else 1,
-                )
-            )
-        )
+        """
+        A `SequenceView` of the slice, which doesn't copy the elements (call `force`
+        on it for a copy). Any slice is defined, as with built-in sequences.
+
+        >>> from catepyller.data.vector import Vector
+        >>> Vector.of(1, 2, 3, 4)[::-2]
+        SequenceView(4, 2)
+        """
+        from catepyller.data.sequence_view import SequenceView
+
+        return Some(SequenceView(self, range(self.length)[slice]))
+
+    def view(self) -> View[A]:
+        """
+        Lazy pipeline over this sequence which fuses `map`, `filter`, `flat_map`,
+        `take` and `drop` into a single pass (see `View`).
+        """
+        return View(self.__iter__, self.from_iter)
 
     # --- Unsafe variants ---
 
+    # The errors are only built when they are raised
+
     def get_unsafe(self, index: int) -> A:
-        return self.get(index).unwrap_or_throw_unsafe(
-            IndexError(f"Index ({index}) out of range")
-        )
+        value = self.get(index)
+        if value is Nothing:
+            raise IndexError(f"Index ({index}) out of range")
+        return value.unwrap_unsafe()
 
     def get_slice_unsafe(self, slice: slice) -> Sequence[A]:
-        return self.get_slice(slice).unwrap_or_throw_unsafe(
-            IndexError(f"Slice ({slice}) undefined")
-        )
+        values = self.get_slice(slice)
+        if values is Nothing:
+            raise IndexError(f"Slice ({slice}) undefined")
+        return values.unwrap_unsafe()
 
     # --- Interface to satisfy `Sequence` ---
 
@@ -98,3 +114,38 @@ class Sequence(typing.Sequence[A], typing.Collection[A], typing.Sized):
 
     def __len__(self) -> int:
         return self.length
+
+    # --- Replacements for the `typing.Sequence` mixins ---
+
+    # The mixins index from 0 until `__getitem__` raises `IndexError`, so each element
+    # goes through `__getitem__` (and the failed lookup at the end allocates an error).
+    # These go through `get_unsafe` for each index instead, which is only linear when
+    # `get_unsafe` is O(1) (see the class docstring), and `index` goes through
+    # `__iter__` so that it uses an implementation's own `__iter__` when it has one.
+    # The `__contains__` and `count` mixins already iterate.
+
+    def __iter__(self) -> Iterator[A]:
+        return map(self.get_unsafe, range(self.length))
+
+    def __reversed__(self) -> Iterator[A]:
+        return map(self.get_unsafe, reversed(range(self.length)))
+
+    def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        Position of the first occurrence of `value` between `start` and `stop`, which
+        are interpreted as in a slice.
+
+        >>> from catepyller.data.vector import Vector
+        >>> Vector.of(1, 2, 1, 2).index(2, 2)
+        3
+        >>> Vector.of(1, 2, 1, 2)[::-1].index(3)
+        Traceback (most recent call last):
+        ...
+        ValueError: 3 is not in the sequence
+        """
+        indices = range(self.length)[start:stop]
+        values = itertools.islice(self, indices.start, indices.stop)
+        for index, v in enumerate(values, indices.start):
+            if v is value or v == value:
+                return index
+        raise ValueError(f"{value!r} is not in the sequence")
@@ -1,6 +1,6 @@
 from abc import ABC
 from functools import cache
-from typing import Any, Protocol, TypeVar
+from typing import Any, Collection, Protocol, TypeVar
 
 T_contra = TypeVar("T_contra", contravariant=True)
 
@@ -10,6 +10,8 @@ class Wrapper(ABC):
     Helper class to simplifying dataclasses designed to wrap a single `value`.
     """
 
+    __slots__ = ()
+
     value: Any
 
     def simpleRepr(self) -> str:
@@ -39,11 +41,42 @@ class Singleton:
     True
     """
 
+    __slots__ = ()
+
     @cache  # type:ignore
     def __new__(cls):
         return object.__new__(cls)
 
 
+class Frozen:
+    """
+    Slotted replacement for `@dataclass(frozen=True)`, avoiding a per-instance
+    `__dict__`.
+
+    Subclasses declare their fields in `__slots__` and assign them once in `__init__`
+    with `object.__setattr__(self, "value", value)` (as frozen dataclasses do), which
+    bypasses the `__setattr__` guard below.
+
+    >>> class Example(Frozen):
+    ...   __slots__ = ("value",)
+    ...   def __init__(self, value: int) -> None:
+    ...     object.__setattr__(self, "value", value)
+    >>> example = Example(12)
+    >>> example.value = 13
+    Traceback (most recent call last):
+    ...
+    AttributeError: cannot assign to field 'value'
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete field '{name}'")
+
+
 class SupportsDunderLT(Protocol[T_contra]):
     def __lt__(self, __other: T_contra) -> bool:
         ...
@@ -55,3 +88,14 @@ class SupportsDunderGT(Protocol[T_contra]):
 
 
 SupportsComparison = SupportsDunderLT[Any] | SupportsDunderGT[Any]
+
+
+def equal_elements(a: Collection[Any], b: Collection[Any]) -> bool:
+    """
+    Whether `a` and `b` have as many elements, pairwise equal, for the `__eq__` of
+    collections compared by their elements. Identical elements aren't compared.
+
+    >>> equal_elements([1, 2], (1, 2)), equal_elements([1], [1, 2])
+    (True, False)
+    """
+    return len(a) == len(b) and all(x is y or x == y for x, y in zip(a, b))
@@ -19,7 +19,7 @@ def main():
     ages = set(people.map(lambda p: p.age))
     print(ages)
 
-    head, tail = people.decap
+    head, tail = people.split_first()
     print(head, tail)
 
 
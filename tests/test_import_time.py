@@ -0,0 +1,19 @@
+import os
+
+import pytest
+
+from benchmarks.import_time import BUDGETS, heavy_imports, run
+
+
+@pytest.mark.parametrize("statement", list(BUDGETS))
+def test_imports_stay_light(statement: str) -> None:
+    assert heavy_imports(statement) == []
+
+
+@pytest.mark.skipif(
+    os.environ.get("CATEPYLLER_IMPORT_BUDGETS") != "1",
+    reason="wall-clock budgets, set CATEPYLLER_IMPORT_BUDGETS=1 to check them",
+)
+def test_imports_stay_within_budget() -> None:
+    # `pytest -s` shows the table of timings
+    assert run(repeat=3) == 0
@@ -0,0 +1,146 @@
+"""
+Operations on inputs far longer than the recursion limit, which the docstrings only
+show on small ones: nothing may recurse once per element.
+"""
+import pickle
+
+from catepyller.data.chunked_list import ChunkedList
+from catepyller.data.lazy_list import LazyList
+from catepyller.data.list import Elem, List, Nil
+from catepyller.data.option import Some
+from catepyller.functions.semigroup import combine_all
+
+N = 10**6
+
+
+# --- List ---
+
+
+def test_list_flat_map() -> None:
+    doubled = List.from_iter(range(N)).flat_map(lambda x: List.of(x, x))
+    assert doubled.drop_first(2 * N - 2) == List.of(N - 1, N - 1)
+
+
+def test_list_extend() -> None:
+    extended = List.from_iter(range(N)).extend(List.of(-1))
+    assert extended.drop_first(N - 1) == List.of(N - 1, -1)
+
+
+def test_list_take_first() -> None:
+    taken = List.from_iter(range(N)).take_first(N - 1)
+    assert taken.drop_first(N - 2) == List.of(N - 2)
+
+
+def test_list_drop_first() -> None:
+    assert List.from_iter(range(N)).drop_first(N - 1) == List.of(N - 1)
+
+
+def test_list_reverse() -> None:
+    assert List.from_iter(range(N)).reverse().take_first(2) == List.of(N - 1, N - 2)
+
+
+def test_list_filter() -> None:
+    odd = List.from_iter(range(N)).filter(lambda x: x % 2 == 1)
+    assert odd.drop_first(N // 2 - 1) == List.of(N - 1)
+
+
+def test_list_intercalate() -> None:
+    separated = List.from_iter(range(N)).intercalate(-1)
+    assert separated.drop_first(2 * N - 3) == List.of(-1, N - 1)
+
+
+def test_list_len() -> None:
+    assert len(List.from_iter(range(N))) == N
+
+
+def test_list_hash_and_eq() -> None:
+    assert {List.from_iter(range(N)): "key"}[List.from_iter(range(N))] == "key"
+
+
+def test_list_pickle() -> None:
+    numbers = List.from_iter(range(N))
+    assert pickle.loads(pickle.dumps(numbers)) == numbers
+
+
+def test_list_fold_left() -> None:
+    total = List.from_iter(range(N)).fold_left(0, lambda acc, x: acc + x)
+    assert total == N * (N - 1) // 2
+
+
+def test_list_fold_right() -> None:
+    copied = List.from_iter(range(N)).fold_right(Nil, Elem)
+    assert copied.take_first(2) == List.of(0, 1)
+
+
+def test_list_merge() -> None:
+    evens = List.from_iter(range(0, N, 2))
+    merged = evens.merge(List.from_iter(range(1, N, 2)))
+    assert merged.drop_first(N - 2) == List.of(N - 2, N - 1)
+
+
+def test_list_smallest_k() -> None:
+    assert List.from_iter(range(N, 0, -1)).smallest_k(3) == List.of(1, 2, 3)
+
+
+def test_list_group_by() -> None:
+    assert List.from_iter(range(N)).group_by(lambda x: x % 3)[2].length == N // 3
+
+
+def test_list_chunks_of() -> None:
+    chunks = List.from_iter(range(N)).chunks_of(3, drop_remainder=True)
+    assert chunks.last() == List.of(N - 4, N - 3, N - 2)
+
+
+def test_list_window() -> None:
+    # Fewer elements, since each window is a list of its own
+    n = N // 10
+    assert List.from_iter(range(n)).window(3).map(sum).last() == 3 * n - 6
+
+
+# --- ChunkedList ---
+
+
+def test_chunked_list_map() -> None:
+    mapped = ChunkedList.from_iter(range(N)).map(lambda x: x + 1)
+    assert mapped.drop_first(N - 1) == ChunkedList.of(N)
+
+
+def test_chunked_list_drop_first() -> None:
+    assert ChunkedList.from_iter(range(N)).drop_first(N - 1) == ChunkedList.of(N - 1)
+
+
+def test_chunked_list_reverse() -> None:
+    reversed_list = ChunkedList.from_iter(range(N)).reverse()
+    assert reversed_list.take_first(2) == ChunkedList.of(N - 1, N - 2)
+
+
+# --- LazyList ---
+
+
+def test_lazy_list_drop_first() -> None:
+    assert LazyList.count().drop_first(N).first() == N
+
+
+def test_lazy_list_iter() -> None:
+    assert sum(LazyList.count().take_first(N)) == N * (N - 1) // 2
+
+
+def test_lazy_list_chunks_of() -> None:
+    n = N // 10
+    chunks = LazyList.count().chunks_of(3).drop_first(n)
+    assert chunks.first() == List.of(3 * n, 3 * n + 1, 3 * n + 2)
+
+
+# --- View ---
+
+
+def test_view_fold() -> None:
+    doubled = List.from_iter(range(N)).view().map(lambda x: x * 2)
+    assert doubled.fold(0, lambda a, b: a + b) == N * (N - 1)
+
+
+# --- Semigroup ---
+
+
+def test_combine_all() -> None:
+    assert combine_all(tuple(range(N)), max) == Some(N - 1)
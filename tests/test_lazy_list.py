@@ -0,0 +1,25 @@
+import pytest
+
+from catepyller.data.lazy_list import LazyList
+from catepyller.data.list import List
+
+
+def fail_at_2(x: int) -> int:
+    if x == 2:
+        raise ValueError(x)
+    return x
+
+
+def test_retry_after_map_raises() -> None:
+    numbers = LazyList.count().map(fail_at_2)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            numbers.take_first(5).to_list()
+    assert numbers.take_first(2).to_list() == List.of(0, 1)
+
+
+def test_retry_after_generator_raises() -> None:
+    numbers = LazyList.from_iter(fail_at_2(x) for x in range(6))
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            numbers.to_list()